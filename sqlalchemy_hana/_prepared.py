@@ -0,0 +1,169 @@
+"""Prepared statement cache."""
+
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict
+from typing import TYPE_CHECKING, Any
+
+from typing_extensions import override
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine.interfaces import DBAPIConnection, DBAPICursor
+
+
+class PreparedStatementStats:
+    """Thread-safe hit and miss counters shared by the caches of all connections."""
+
+    def __init__(self) -> None:
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+    def record(self, hit: bool) -> None:
+        """Count a cache lookup."""
+        with self._lock:
+            if hit:
+                self.hits += 1
+            else:
+                self.misses += 1
+
+
+class PreparedStatementCache:
+    """LRU cache of the prepared statements of one DBAPI connection.
+
+    Each statement is prepared on a dedicated cursor, which is used by one execution at a
+    time; while a statement is in use, further executions of it are not cached.
+    """
+
+    def __init__(
+        self, connection: DBAPIConnection, size: int, stats: PreparedStatementStats
+    ) -> None:
+        self.connection = connection
+        self.size = size
+        self.stats = stats
+        self._cursors: OrderedDict[str, DBAPICursor] = OrderedDict()
+        self._in_use: set[str] = set()
+
+    def __len__(self) -> int:
+        return len(self._cursors)
+
+    def acquire(self, statement: str) -> DBAPICursor | None:
+        """Return the cursor holding the prepared statement.
+
+        The statement is prepared if it is not cached yet.
+        ``None`` is returned if the statement is in use by another execution.
+        """
+        if statement in self._in_use:
+            return None
+
+        cursor = self._cursors.get(statement)
+        self.stats.record(cursor is not None)
+        if cursor is None:
+            cursor = self.connection.cursor()
+            try:
+                cursor.prepare(statement)
+            except BaseException:
+                cursor.close()
+                raise
+            self._cursors[statement] = cursor
+            self._evict()
+        else:
+            self._cursors.move_to_end(statement)
+
+        self._in_use.add(statement)
+        return cursor
+
+    def release(self, statement: str, cursor: DBAPICursor) -> None:
+        """Return a cursor acquired for the given statement to the cache."""
+        self._in_use.discard(statement)
+        if self._cursors.get(statement) is not cursor:
+            # the statement was removed from the cache while it was in use
+            cursor.close()
+
+    def clear(self) -> None:
+        """Remove all statements from the cache.
+
+        Cursors in use are closed once they are released.
+        """
+        cursors, self._cursors = self._cursors, OrderedDict()
+        for statement, cursor in cursors.items():
+            if statement not in self._in_use:
+                cursor.close()
+
+    def _evict(self) -> None:
+        for statement in list(self._cursors):
+            if len(self._cursors) <= self.size:
+                break
+            if statement not in self._in_use:
+                self._cursors.pop(statement).close()
+
+
+class PreparedCursor:
+    """Proxy of a cursor holding a cached prepared statement.
+
+    Closing the proxy returns the cursor to the cache.
+    Other statements executed using the proxy, e.g. to fetch sequence values, are executed
+    on a separate cursor to keep the prepared statement.
+    """
+
+    def __init__(
+        self, cache: PreparedStatementCache, statement: str, cursor: DBAPICursor
+    ) -> None:
+        self._cache = cache
+        self._cursor = cursor
+        self._other: DBAPICursor | None = None
+        self._active = cursor
+        self._closed = False
+        self.prepared_statement = statement
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._active, name)
+
+    @override
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in {
+            "_cache",
+            "_cursor",
+            "_other",
+            "_active",
+            "_closed",
+            "prepared_statement",
+        }:
+            super().__setattr__(name, value)
+        else:
+            setattr(self._cursor, name, value)
+
+    def executeprepared(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute the prepared statement."""
+        self._active = self._cursor
+        return self._cursor.executeprepared(*args, **kwargs)
+
+    def executemanyprepared(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute the prepared statement multiple times."""
+        self._active = self._cursor
+        return self._cursor.executemanyprepared(*args, **kwargs)
+
+    def execute(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute another statement on a separate cursor."""
+        self._active = self._other_cursor()
+        return self._active.execute(*args, **kwargs)
+
+    def executemany(self, *args: Any, **kwargs: Any) -> Any:
+        """Execute another statement multiple times on a separate cursor."""
+        self._active = self._other_cursor()
+        return self._active.executemany(*args, **kwargs)
+
+    def close(self) -> None:
+        """Return the cursor to the cache."""
+        if self._closed:
+            return
+        self._closed = True
+        if self._other is not None:
+            self._other.close()
+        self._cache.release(self.prepared_statement, self._cursor)
+
+    def _other_cursor(self) -> DBAPICursor:
+        if self._other is None:
+            self._other = self._cache.connection.cursor()
+        return self._other
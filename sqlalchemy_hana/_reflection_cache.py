@@ -0,0 +1,317 @@
+"""Persistent reflection snapshot cache."""
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections.abc import Callable, Collection
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, TypeVar
+
+import sqlalchemy
+from sqlalchemy import sql
+from sqlalchemy.engine import reflection
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_SNAPSHOT_VERSION = 2
+
+# the catalog attributes used by the reflection methods, so that every change of a reflected
+# object changes the fingerprint
+_FINGERPRINT_SOURCES = (
+    ("SYS.OBJECTS", ("OBJECT_NAME", "OBJECT_TYPE", "OBJECT_OID")),
+    ("SYS.TABLES", ("TABLE_NAME", "TABLE_TYPE", "IS_TEMPORARY", "COMMENTS")),
+    *(
+        (
+            view,
+            (
+                name,
+                "COLUMN_NAME",
+                "POSITION",
+                "DATA_TYPE_NAME",
+                "LENGTH",
+                "SCALE",
+                "IS_NULLABLE",
+                "DEFAULT_VALUE",
+                "COMMENTS",
+                "GENERATED_ALWAYS_AS",
+                "GENERATION_TYPE",
+            ),
+        )
+        for view, name in (
+            ("SYS.TABLE_COLUMNS", "TABLE_NAME"),
+            ("SYS.VIEW_COLUMNS", "VIEW_NAME"),
+        )
+    ),
+    (
+        "SYS.CONSTRAINTS",
+        (
+            "TABLE_NAME",
+            "CONSTRAINT_NAME",
+            "COLUMN_NAME",
+            "POSITION",
+            "IS_PRIMARY_KEY",
+            "IS_UNIQUE_KEY",
+            "CHECK_CONDITION",
+        ),
+    ),
+    (
+        "SYS.REFERENTIAL_CONSTRAINTS",
+        (
+            "TABLE_NAME",
+            "CONSTRAINT_NAME",
+            "COLUMN_NAME",
+            "POSITION",
+            "REFERENCED_SCHEMA_NAME",
+            "REFERENCED_TABLE_NAME",
+            "REFERENCED_COLUMN_NAME",
+            "UPDATE_RULE",
+            "DELETE_RULE",
+        ),
+    ),
+    (
+        "SYS.INDEX_COLUMNS",
+        ("TABLE_NAME", "INDEX_NAME", "COLUMN_NAME", "POSITION", '"CONSTRAINT"'),
+    ),
+)
+
+_VECTOR_INDEXES_FINGERPRINT_SOURCE = (
+    "SYS.VECTOR_INDEXES",
+    (
+        "TABLE_NAME",
+        "INDEX_NAME",
+        "INDEX_TYPE",
+        "SIMILARITY_FUNCTION",
+        "BUILD_CONFIGURATION",
+        "SEARCH_CONFIGURATION",
+    ),
+)
+
+
+def _fingerprint_query(sources: Collection[tuple[str, tuple[str, ...]]]) -> str:
+    # every row is hashed on the server and the first 60 bits of the hashes are summed up, so
+    # that only a single short row is returned instead of the catalog rows
+    rows = "\nUNION ALL\n".join(
+        f"SELECT HASH_SHA256(TO_BINARY('{view}'), "
+        f"{', '.join(_fingerprint_value(column) for column in columns)}) AS ROW_HASH\n"
+        f"FROM {view} WHERE SCHEMA_NAME=:schema"
+        for view, columns in sources
+    )
+    return (
+        "SELECT COUNT(*), SUM(TO_DECIMAL(HEXTONUM(LEFT(BINTOHEX(ROW_HASH), 15)), 38, 0))\n"
+        f"FROM (\n{rows}\n)"
+    )
+
+
+def _fingerprint_value(column: str) -> str:
+    # the values are prefixed by their length to keep the hashed bytes unambiguous
+    value = f"TO_NVARCHAR({column})"
+    return f"TO_BINARY(IFNULL(LENGTH({value}) || ':' || {value}, '-'))"
+
+
+SCHEMA_FINGERPRINT_QUERY = _fingerprint_query(_FINGERPRINT_SOURCES)
+_VECTOR_INDEXES_SCHEMA_FINGERPRINT_QUERY = _fingerprint_query(
+    (*_FINGERPRINT_SOURCES, _VECTOR_INDEXES_FINGERPRINT_SOURCE)
+)
+
+_MISSING = object()
+
+
+class ReflectionSnapshotCache:
+    """Cache of reflected schema information stored in a local directory.
+
+    One file is written per database, schema and reflection method.
+    A snapshot is only used if the fingerprint of the schema did not change since it was
+    written, otherwise it is replaced on the next reflection.
+    Each snapshot file is read at most once per fingerprint, afterwards its data is kept in
+    memory.
+    """
+
+    def __init__(self, directory: str | os.PathLike[str]) -> None:
+        self.directory = Path(directory)
+        self._lock = threading.Lock()
+        self._snapshots: dict[
+            tuple[str, str], tuple[str, dict[tuple[Any, ...], Any]]
+        ] = {}
+
+    def path(self, database: str, schema: str, key: tuple[Any, ...]) -> Path:
+        """Return the path of the snapshot file of ``key`` in the given database and schema."""
+        return self.directory / _digest(database, schema) / f"{_digest(*key)}.pickle"
+
+    def get(
+        self,
+        database: str,
+        schema: str,
+        fingerprint: str,
+        key: tuple[Any, ...],
+        compute: Callable[[], Any],
+    ) -> Any:
+        """Return the cached data of ``key``.
+
+        ``compute`` is called if the snapshot does not contain the key or is outdated.
+        """
+        with self._lock:
+            snapshot = self._snapshots.get((database, schema))
+            if snapshot is None or snapshot[0] != fingerprint:
+                snapshot = self._snapshots[database, schema] = (fingerprint, {})
+            entries = snapshot[1]
+            if key in entries:
+                return entries[key]
+
+        # reading and computing the data is done without holding the lock, so that schemas
+        # can be reflected in parallel
+        path = self.path(database, schema, key)
+        data = self._load(path, fingerprint)
+        if data is _MISSING:
+            data = compute()
+            self._store(path, fingerprint, data)
+        with self._lock:
+            entries[key] = data
+        return data
+
+    def _load(self, path: Path, fingerprint: str) -> Any:
+        try:
+            with path.open("rb") as file:
+                snapshot = pickle.load(file)
+        except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+            return _MISSING
+        if snapshot.get("version") != _snapshot_version() or (
+            snapshot.get("fingerprint") != fingerprint
+        ):
+            return _MISSING
+        return snapshot["data"]
+
+    def _store(self, path: Path, fingerprint: str, data: Any) -> None:
+        snapshot = {
+            "version": _snapshot_version(),
+            "fingerprint": fingerprint,
+            "data": data,
+        }
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # write to a temporary file first, concurrent readers never see partial snapshots
+        with tempfile.NamedTemporaryFile(
+            "wb", dir=path.parent, suffix=".tmp", delete=False
+        ) as file:
+            pickle.dump(snapshot, file, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(file.name, path)
+
+
+def _digest(*parts: Any) -> str:
+    return hashlib.sha256("\0".join(str(part) for part in parts).encode()).hexdigest()
+
+
+def _snapshot_version() -> tuple[Any, ...]:
+    return (_SNAPSHOT_VERSION, sqlalchemy.__version__)
+
+
+@reflection.cache
+def _get_schema_fingerprint(
+    dialect: Any, connection: Connection, schema: str, **kw: Any
+) -> str:
+    query = (
+        _VECTOR_INDEXES_SCHEMA_FINGERPRINT_QUERY
+        if dialect.supports_vector_indexes
+        else SCHEMA_FINGERPRINT_QUERY
+    )
+    count, checksum = connection.execute(
+        sql.text(query).bindparams(schema=dialect.denormalize_name(schema))
+    ).one()
+    return f"{count}:{checksum}"
+
+
+def _cached(
+    dialect: Any,
+    connection: Connection,
+    schema: str | None,
+    key: tuple[Any, ...],
+    compute: Callable[[], Any],
+    **kw: Any,
+) -> Any:
+    cache: ReflectionSnapshotCache = dialect.reflection_cache
+    schema_name = schema or dialect.default_schema_name
+    return cache.get(
+        connection.engine.url.render_as_string(hide_password=True),
+        schema_name,
+        _get_schema_fingerprint(dialect, connection, schema_name, **kw),
+        key,
+        compute,
+    )
+
+
+def snapshot_names(fn: _F) -> _F:
+    """Serve a reflection method returning object names from the snapshot cache."""
+
+    @functools.wraps(fn)
+    def wrapper(
+        self: Any, connection: Connection, schema: str | None = None, **kw: Any
+    ) -> Any:
+        if self.reflection_cache is None:
+            return fn(self, connection, schema, **kw)
+        return _cached(
+            self,
+            connection,
+            schema,
+            (fn.__name__,),
+            lambda: fn(self, connection, schema, **kw),
+            **kw,
+        )
+
+    return wrapper  # type: ignore[return-value]
+
+
+def snapshot_multi(fn: _F) -> _F:
+    """Serve a ``get_multi_*`` reflection method from the snapshot cache.
+
+    The data of all objects of a schema is cached, ``filter_names`` is applied afterwards.
+    """
+
+    @functools.wraps(fn)
+    def wrapper(
+        self: Any,
+        connection: Connection,
+        *,
+        schema: str | None = None,
+        filter_names: Collection[str] | None = None,
+        scope: reflection.ObjectScope = reflection.ObjectScope.DEFAULT,
+        kind: reflection.ObjectKind = reflection.ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Any:
+        if self.reflection_cache is None:
+            return fn(
+                self,
+                connection,
+                schema=schema,
+                filter_names=filter_names,
+                scope=scope,
+                kind=kind,
+                **kw,
+            )
+
+        data = _cached(
+            self,
+            connection,
+            schema,
+            (fn.__name__, scope.value, kind.value),
+            lambda: [
+                (table_name, value)
+                for (_, table_name), value in fn(
+                    self, connection, schema=schema, scope=scope, kind=kind, **kw
+                )
+            ],
+            **kw,
+        )
+        names = set(filter_names) if filter_names is not None else None
+        return [
+            ((schema, table_name), value)
+            for table_name, value in data
+            if names is None or table_name in names
+        ]
+
+    return wrapper  # type: ignore[return-value]
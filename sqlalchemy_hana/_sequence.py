@@ -0,0 +1,77 @@
+"""Sequence value cache."""
+
+from __future__ import annotations
+
+import threading
+from collections import deque
+from collections.abc import Callable
+
+
+def sequence_values_query(sequence: str) -> str:
+    """Return a query fetching multiple values of the given sequence in one statement.
+
+    The number of values is given by the only bind parameter.
+    """
+    return f"SELECT {sequence}.NEXTVAL FROM SERIES_GENERATE_INTEGER(1, 0, ?)"
+
+
+class SequenceCache:
+    """Thread-safe cache of prefetched sequence values.
+
+    Values are fetched in blocks of ``block_size`` and handed out locally.
+    Requests for more values than cached fetch the missing values in one go.
+    """
+
+    def __init__(self, block_size: int) -> None:
+        if block_size < 1:
+            raise ValueError("The sequence cache block size must be greater than 0")
+        self.block_size = block_size
+        self._values: dict[str, deque[int]] = {}
+        self._fetch_locks: dict[str, threading.Lock] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(
+        self, sequence: str, count: int, fetch: Callable[[int], list[int]]
+    ) -> list[int]:
+        """Return ``count`` values of the given sequence.
+
+        ``fetch`` is called with the number of values to fetch if the cache runs dry.
+        It is called without holding the cache lock, so that other sequences are not blocked by
+        the round trip and a failing fetch may invalidate the cache.
+        """
+        while True:
+            with self._lock:
+                values = self._take(sequence, count)
+                if values is not None:
+                    return values
+                fetch_lock = self._fetch_locks.setdefault(sequence, threading.Lock())
+
+            with fetch_lock:
+                with self._lock:
+                    # another thread might have fetched values in the meantime
+                    values = self._take(sequence, count)
+                    if values is not None:
+                        return values
+                    missing = count - len(self._values[sequence])
+                    generation = self._generation
+
+                fetched = sorted(fetch(max(self.block_size, missing)))
+
+                with self._lock:
+                    # values fetched before an invalidation are dropped
+                    if generation == self._generation:
+                        self._values.setdefault(sequence, deque()).extend(fetched)
+
+    def _take(self, sequence: str, count: int) -> list[int] | None:
+        # called with the lock held
+        values = self._values.setdefault(sequence, deque())
+        if len(values) < count:
+            return None
+        return [values.popleft() for _ in range(count)]
+
+    def invalidate(self) -> None:
+        """Drop all cached values, including values of fetches in progress."""
+        with self._lock:
+            self._values.clear()
+            self._generation += 1
@@ -0,0 +1,252 @@
+"""Circuit breaker for overloaded SAP HANA databases.
+
+If too many statements fail because the database is overloaded or out of memory, the circuit
+opens and further statements fail immediately with :py:exc:`CircuitOpenError` instead of adding
+load to the database.
+After a timeout, the circuit is half-open: a single probe query is sent to the database and the
+circuit is closed again if it succeeds.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Iterable
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import event
+from sqlalchemy.exc import ArgumentError, DBAPIError, SQLAlchemyError
+
+from sqlalchemy_hana.errors import (
+    DatabaseOutOfMemoryError,
+    DatabaseOverloadedError,
+    HANAError,
+    convert_dbapi_error,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Dialect, Engine, ExceptionContext
+    from sqlalchemy.engine.interfaces import DBAPICursor
+    from sqlalchemy.ext.asyncio import AsyncEngine
+    from sqlalchemy.pool import ConnectionPoolEntry
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitOpenError(SQLAlchemyError):
+    """Raised instead of executing a statement while the circuit is open."""
+
+
+class CircuitBreaker:
+    # pylint: disable=too-many-instance-attributes
+    """Circuit breaker of an engine, see :py:func:`enable_circuit_breaker`.
+
+    The outcome of the last ``window_size`` statements is tracked.
+    Once at least ``minimum_calls`` outcomes are known and the share of statements failing
+    with one of ``errors`` reaches ``failure_rate``, the circuit opens for ``reset_timeout``
+    seconds.
+    Afterwards, the next statement first executes ``probe`` on its connection; the circuit
+    closes if the probe succeeds and opens again otherwise.
+
+    ``listeners`` are called with the old and the new state on each state transition.
+    """
+
+    def __init__(
+        self,
+        failure_rate: float = 0.5,
+        minimum_calls: int = 20,
+        window_size: int = 100,
+        reset_timeout: float = 30.0,
+        errors: Iterable[type[HANAError]] = (
+            DatabaseOverloadedError,
+            DatabaseOutOfMemoryError,
+        ),
+        probe: str = "SELECT 1 FROM DUMMY",
+        listeners: Iterable[Callable[[str, str], None]] = (),
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if not 0 < failure_rate <= 1:
+            raise ArgumentError("failure_rate must be greater than 0 and at most 1")
+        if not 0 < minimum_calls <= window_size:
+            raise ArgumentError(
+                "minimum_calls must be greater than 0 and at most window_size"
+            )
+        if reset_timeout < 0:
+            raise ArgumentError("reset_timeout must not be negative")
+        self.failure_rate = failure_rate
+        self.minimum_calls = minimum_calls
+        self.reset_timeout = reset_timeout
+        self.errors = tuple(errors)
+        self.probe = probe
+        self.listeners = list(listeners)
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self._outcomes: deque[bool] = deque(maxlen=window_size)
+        self._failures = 0
+
+    @property
+    def state(self) -> str:
+        """The current state, one of :py:data:`CLOSED`, :py:data:`OPEN` and :py:data:`HALF_OPEN`."""
+        with self._lock:
+            if self._state == OPEN and self._timed_out():
+                return HALF_OPEN
+            return self._state
+
+    def install(self, engine: Engine | AsyncEngine) -> None:
+        """Register the event listeners of the circuit breaker on an engine."""
+        # the asyncio extension is not imported, it requires the optional greenlet library
+        engine = getattr(engine, "sync_engine", engine)
+        event.listen(engine, "before_cursor_execute", self._before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", self._after_cursor_execute)
+        event.listen(engine, "handle_error", self._handle_error)
+        event.listen(engine, "do_connect", self._do_connect)
+
+    def reset(self) -> None:
+        """Close the circuit and forget all recorded outcomes."""
+        with self._lock:
+            self._outcomes.clear()
+            self._failures = 0
+            self._probing = False
+            self._transition(CLOSED)
+
+    def record(self, error: BaseException | None) -> None:
+        """Record the outcome of a statement, ``error`` is ``None`` if it succeeded."""
+        if isinstance(error, DBAPIError) and not isinstance(error, HANAError):
+            error = convert_dbapi_error(error)
+        failed = isinstance(error, self.errors)
+        with self._lock:
+            if self._state != CLOSED:
+                return
+            if len(self._outcomes) == self._outcomes.maxlen:
+                self._failures -= self._outcomes[0]
+            self._outcomes.append(failed)
+            self._failures += failed
+            if len(
+                self._outcomes
+            ) >= self.minimum_calls and self._failures >= self.failure_rate * len(
+                self._outcomes
+            ):
+                self._open()
+
+    def _timed_out(self) -> bool:
+        return self._clock() - self._opened_at >= self.reset_timeout
+
+    def _transition(self, state: str) -> None:
+        # called with the lock held
+        old, self._state = self._state, state
+        if old != state:
+            for listener in self.listeners:
+                listener(old, state)
+
+    def _open(self) -> None:
+        self._opened_at = self._clock()
+        self._outcomes.clear()
+        self._failures = 0
+        self._transition(OPEN)
+
+    def _acquire(self) -> bool:
+        """Check if a statement may be executed, return if a probe is needed first."""
+        if self._state == CLOSED:
+            return False
+        with self._lock:
+            if self._state == CLOSED:
+                return False
+            if self._state == OPEN and self._timed_out():
+                self._transition(HALF_OPEN)
+            if self._state == OPEN or self._probing:
+                raise CircuitOpenError("The circuit breaker of the database is open")
+            self._probing = True
+            return True
+
+    def _run_probe(self, connection: Connection) -> None:
+        dbapi_connection = connection.connection.dbapi_connection
+        assert dbapi_connection is not None
+        succeeded = False
+        try:
+            cursor = dbapi_connection.cursor()
+            try:
+                cursor.execute(self.probe)
+                cursor.fetchall()
+            finally:
+                cursor.close()
+            succeeded = True
+        except Exception as error:
+            raise CircuitOpenError(
+                "The circuit breaker of the database is open, the probe query failed"
+            ) from error
+        finally:
+            # also on cancellation or interrupts, otherwise no probe would ever run again
+            with self._lock:
+                self._probing = False
+                if succeeded:
+                    self._transition(CLOSED)
+                else:
+                    self._open()
+
+    def _before_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        if self._acquire():
+            self._run_probe(conn)
+
+    def _after_cursor_execute(
+        self,
+        conn: Connection,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: Any,
+        executemany: bool,
+    ) -> None:
+        self.record(None)
+
+    def _handle_error(self, context: ExceptionContext) -> None:
+        if context.sqlalchemy_exception is not None:
+            self.record(context.sqlalchemy_exception)
+
+    def _do_connect(
+        self,
+        dialect: Dialect,
+        conn_rec: ConnectionPoolEntry,
+        cargs: tuple[Any, ...],
+        cparams: dict[str, Any],
+    ) -> None:
+        with self._lock:
+            if self._state == OPEN and not self._timed_out():
+                raise CircuitOpenError("The circuit breaker of the database is open")
+
+
+def enable_circuit_breaker(
+    engine: Engine | AsyncEngine, breaker: CircuitBreaker | None = None
+) -> CircuitBreaker:
+    """Protect the database of an engine using a circuit breaker.
+
+    If no breaker is given, a :py:class:`CircuitBreaker` with the default parameters is used.
+    The breaker is returned to allow checking its state.
+    """
+    if breaker is None:
+        breaker = CircuitBreaker()
+    breaker.install(engine)
+    return breaker
+
+
+__all__ = (
+    "CLOSED",
+    "HALF_OPEN",
+    "OPEN",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "enable_circuit_breaker",
+)
@@ -0,0 +1,102 @@
+"""Columnar result fetching for SAP HANA."""
+
+from __future__ import annotations
+
+import array
+from collections.abc import Iterator, Sequence
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy.exc import ArgumentError, ResourceClosedError
+
+try:
+    import pyarrow
+except ImportError:  # pragma: no cover
+    pyarrow = None
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import CursorResult
+
+
+def fetch_columns(
+    result: CursorResult[Any], batch_size: int = 10_000, *, arrow: bool | None = None
+) -> Iterator[Any]:
+    """Fetch the remaining rows of a result in batches of columns.
+
+    If pyarrow is installed, each batch is a ``pyarrow.RecordBatch``.
+    Otherwise, each batch is a dictionary mapping the column names to the column values.
+    The values of integer and float columns which are not nullable according to the cursor
+    description and have no result processor are stored in an ``array.array``, the values of
+    all other columns in a list; the container of a column is the same in every batch.
+    ``arrow`` can be used to enforce or to disable the usage of pyarrow.
+
+    The rows are fetched from the cursor without creating a row object per row, the result
+    processors of the column types are applied column-wise per batch.
+    """
+    if batch_size < 1:
+        raise ArgumentError("batch_size must be greater than 0")
+    if arrow is None:
+        arrow = pyarrow is not None
+    elif arrow and pyarrow is None:
+        raise ArgumentError("pyarrow is required to fetch Arrow record batches")
+    if not result.returns_rows:
+        raise ResourceClosedError("This result object does not return rows.")
+
+    names = list(result.keys())
+    metadata = result._metadata
+    processors = metadata._processors
+    # the null_ok flag of the cursor description, unknown if the cursor is already closed
+    description = result.context.cursor.description
+    nullable: Sequence[bool] = (
+        [_nullable(entry) for entry in description]
+        if description
+        else [True] * len(processors)
+    )
+    tuplefilter = metadata._tuplefilter
+    if tuplefilter:
+        processors = tuplefilter(processors)
+        nullable = tuplefilter(nullable)
+
+    # the container of a column is chosen with the first batch, the values of a column which
+    # is not nullable and has no result processor have the same type in all batches
+    typecodes: list[str | None] | None = None
+    while rows := result._fetchmany_impl(batch_size):
+        if tuplefilter:
+            rows = [tuplefilter(row) for row in rows]
+
+        columns = [
+            [processor(value) for value in values] if processor else list(values)
+            for values, processor in zip(zip(*rows), processors)
+        ]
+
+        if arrow:
+            yield pyarrow.RecordBatch.from_arrays(
+                [pyarrow.array(column) for column in columns], names=names
+            )
+            continue
+
+        if typecodes is None:
+            typecodes = [
+                None if processor or is_nullable else _typecode(column)
+                for column, processor, is_nullable in zip(columns, processors, nullable)
+            ]
+        yield {
+            name: array.array(typecode, column) if typecode else column
+            for name, column, typecode in zip(names, columns, typecodes)
+        }
+
+
+def _nullable(entry: tuple[Any, ...]) -> bool:
+    # the null_ok flag is None if the nullability is unknown
+    return len(entry) < 7 or entry[6] is None or bool(entry[6])
+
+
+def _typecode(values: list[Any]) -> str | None:
+    kinds = {type(value) for value in values}
+    if kinds == {int}:
+        return "q"
+    if kinds == {float}:
+        return "d"
+    return None
+
+
+__all__ = ("fetch_columns",)
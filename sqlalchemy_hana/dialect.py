@@ -3,9 +3,20 @@
 
 from __future__ import annotations
 
+import asyncio
+import collections
 import contextlib
+import functools
+import importlib.util
+import json
+import logging
+import os
+import re
 import sys
-from collections.abc import Callable
+import time
+from collections import deque
+from collections.abc import Callable, Collection, Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import closing
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Literal, cast
@@ -16,6 +27,7 @@ from sqlalchemy import (
     Computed,
     Identity,
     Integer,
+    MetaData,
     Pool,
     PrimaryKeyConstraint,
     Sequence,
@@ -28,9 +40,10 @@ from sqlalchemy import (
 from sqlalchemy.connectors.asyncio import (
     AsyncAdapt_dbapi_connection,
     AsyncAdapt_dbapi_cursor,
+    AsyncAdapt_dbapi_ss_cursor,
 )
-from sqlalchemy.engine import Connection, default, reflection
-from sqlalchemy.pool import AsyncAdaptedQueuePool
+from sqlalchemy.engine import Connection, Engine, default, reflection
+from sqlalchemy.pool import AsyncAdaptedQueuePool, PoolProxiedConnection
 from sqlalchemy.schema import CreateColumn
 from sqlalchemy.sql import Select, compiler, functions, sqltypes
 from sqlalchemy.sql.elements import (
@@ -39,20 +52,33 @@ from sqlalchemy.sql.elements import (
     UnaryExpression,
     quoted_name,
 )
+from sqlalchemy.sql.selectable import CTE
 from typing_extensions import override
 
 from sqlalchemy_hana import types as hana_types
-from sqlalchemy_hana.elements import CreateView, DropView, Upsert
+from sqlalchemy_hana._prepared import (
+    PreparedCursor,
+    PreparedStatementCache,
+    PreparedStatementStats,
+)
+from sqlalchemy_hana._reflection_cache import (
+    ReflectionSnapshotCache,
+    snapshot_multi,
+    snapshot_names,
+)
+from sqlalchemy_hana._sequence import SequenceCache, sequence_values_query
+from sqlalchemy_hana.elements import CreateView, DropView, MergeInto, Upsert
 
 if TYPE_CHECKING:
     from typing import ParamSpec, TypeVar
 
-    from sqlalchemy import PoolProxiedConnection
+    from sqlalchemy import Column, Table
     from sqlalchemy.engine import ConnectArgsType
     from sqlalchemy.engine.interfaces import (
         DBAPIConnection,
         DBAPICursor,
         DBAPIModule,
+        ExecutionContext,
         ReflectedCheckConstraint,
         ReflectedColumn,
         ReflectedForeignKeyConstraint,
@@ -60,15 +86,18 @@ if TYPE_CHECKING:
         ReflectedPrimaryKeyConstraint,
         ReflectedTableComment,
         ReflectedUniqueConstraint,
+        TableKey,
     )
     from sqlalchemy.engine.url import URL
     from sqlalchemy.schema import (
         ColumnCollectionConstraint,
+        CreateIndex,
         CreateTable,
         DropConstraint,
     )
-    from sqlalchemy.sql.elements import ExpressionClauseList
+    from sqlalchemy.sql.elements import ColumnElement, ExpressionClauseList, TextClause
     from sqlalchemy.sql.selectable import ForUpdateArg
+    from sqlalchemy.sql.type_api import TypeEngine
 
     RET = TypeVar("RET")
     PARAM = ParamSpec("PARAM")
@@ -98,6 +127,8 @@ with contextlib.suppress(ImportError):
 
     import sqlalchemy_hana.alembic  # noqa: F401
 
+logger = logging.getLogger(__name__)
+
 RESERVED_WORDS = {
     "all",
     "alter",
@@ -372,15 +403,57 @@ class HANAStatementCompiler(compiler.SQLCompiler):
     def visit_upsert(self, upsert: Upsert, **kw: Any) -> str:
         statement: str = super().visit_insert(upsert, **kw)
         assert statement.startswith("INSERT INTO")
-        statement = statement.replace("INSERT INTO", "UPSERT")
+        statement = "UPSERT" + statement[len("INSERT INTO") :]
 
-        if upsert._where_criteria:
+        if upsert._with_primary_key:
+            if upsert._where_criteria:
+                raise exc.CompileError(
+                    "UPSERT ... WITH PRIMARY KEY can not be combined with a WHERE clause"
+                )
+            statement += " WITH PRIMARY KEY"
+        elif upsert._where_criteria:
             where = self._generate_delimited_and_list(upsert._where_criteria, **kw)
             if where:
                 statement += f" WHERE {where}"
 
         return statement
 
+    def visit_merge_into(self, merge: MergeInto, **kw: Any) -> str:
+        if not merge._when_clauses:
+            raise exc.CompileError("MERGE INTO requires at least one WHEN clause")
+
+        self.stack.append(
+            {"correlate_froms": set(), "asfrom_froms": set(), "selectable": merge}
+        )
+
+        source = merge.source
+        if isinstance(source, CTE):
+            # SAP HANA does not support a WITH clause for MERGE INTO
+            source = cast("Select[Any]", source.element).subquery(source.name)
+
+        statement = (
+            f"MERGE INTO {merge.table._compiler_dispatch(self, asfrom=True, **kw)} "
+            f"USING {source._compiler_dispatch(self, asfrom=True, **kw)} "
+            f"ON {self.process(merge.onclause, **kw)}"
+        )
+        for when in merge._when_clauses:
+            statement += " WHEN MATCHED" if when.matched else " WHEN NOT MATCHED"
+            if when.condition is not None:
+                statement += f" AND {self.process(when.condition, **kw)}"
+            statement += f" THEN {when.action}"
+
+            columns = [self.preparer.format_column(column) for column in when.columns]
+            values = [self.process(value, **kw) for value in when.values]
+            if when.action == "UPDATE":
+                statement += " SET " + ", ".join(
+                    f"{column} = {value}" for column, value in zip(columns, values)
+                )
+            elif when.action == "INSERT":
+                statement += f" ({', '.join(columns)}) VALUES ({', '.join(values)})"
+
+        self.stack.pop(-1)
+        return statement
+
     def visit_now_func(self, fn: functions.now, **kw: Any) -> str:
         return "CURRENT_TIMESTAMP"
 
@@ -460,6 +533,22 @@ class HANATypeCompiler(compiler.GenericTypeCompiler):
             return f"REAL_VECTOR({type_.length})"
         return "REAL_VECTOR"
 
+    def visit_HALF_VECTOR(self, type_: hana_types.HALF_VECTOR[Any], **kw: Any) -> str:
+        # SAP HANA special type
+        if type_.length is not None:
+            return f"HALF_VECTOR({type_.length})"
+        return "HALF_VECTOR"
+
+    def visit_ST_GEOMETRY(self, type_: hana_types.ST_GEOMETRY, **kw: Any) -> str:
+        if type_.srid is not None:
+            return f"ST_GEOMETRY({type_.srid})"
+        return "ST_GEOMETRY"
+
+    def visit_ST_POINT(self, type_: hana_types.ST_POINT, **kw: Any) -> str:
+        if type_.srid is not None:
+            return f"ST_POINT({type_.srid})"
+        return "ST_POINT"
+
     def __render_string_type(self, name: str, length: int | None) -> str:
         text = name
         if length:
@@ -515,6 +604,67 @@ class HANADDLCompiler(compiler.DDLCompiler):
 
         return result
 
+    @override
+    def visit_create_index(
+        self,
+        create: CreateIndex,
+        include_schema: bool = False,
+        include_table_schema: bool = True,
+        **kw: Any,
+    ) -> str:
+        index = create.element
+        index_type = index.kwargs.get("hana_index_type")
+        if index_type is None:
+            return super().visit_create_index(
+                create, include_schema, include_table_schema, **kw
+            )
+
+        self._verify_index_table(index)
+        assert index.table is not None
+        if index_type.upper() != "HNSW":
+            raise exc.CompileError(f"Unsupported index type '{index_type}'")
+        if index.name is None:
+            raise exc.CompileError("CREATE INDEX requires that the index have a name")
+        if len(index.expressions) != 1 or index.unique:
+            raise exc.CompileError(
+                "A vector index must be a non-unique index on exactly one column"
+            )
+
+        similarity_function = index.kwargs.get(
+            "hana_similarity_function", "COSINE_SIMILARITY"
+        ).upper()
+        if similarity_function not in ("COSINE_SIMILARITY", "L2DISTANCE"):
+            raise exc.CompileError(
+                f"Unsupported similarity function '{similarity_function}'"
+            )
+
+        name = self._prepared_index_name(index, include_schema=include_schema)
+        table = self.preparer.format_table(index.table, use_schema=include_table_schema)
+        column = self.sql_compiler.process(
+            cast("ColumnElement[Any]", index.expressions[0]),
+            include_table=False,
+            literal_binds=True,
+        )
+        text = (
+            f"CREATE HNSW VECTOR INDEX {name} ON {table} ({column}) "
+            f"SIMILARITY FUNCTION {similarity_function}"
+        )
+        for clause, key in (
+            ("BUILD CONFIGURATION", "hana_build_configuration"),
+            ("SEARCH CONFIGURATION", "hana_search_configuration"),
+        ):
+            configuration = index.kwargs.get(key)
+            if configuration is not None:
+                if not isinstance(configuration, str):
+                    configuration = json.dumps(configuration)
+                configuration = self.sql_compiler.render_literal_value(
+                    configuration, sqltypes.STRINGTYPE
+                )
+                text += f" {clause} {configuration}"
+        if index.kwargs.get("hana_online"):
+            text += " ONLINE"
+        return text
+
     @override
     def visit_drop_constraint(self, drop: DropConstraint, **kw: Any) -> str:
         if isinstance(drop.element, PrimaryKeyConstraint):
@@ -556,10 +706,173 @@ class HANADDLCompiler(compiler.DDLCompiler):
 
 
 class HANAExecutionContext(default.DefaultExecutionContext):
+    dialect: HANAHDBCLIDialect
+
+    @util.memoized_property
+    def _sequence_values(self) -> dict[str, deque[int]]:
+        return {}
+
+    @override
+    def create_server_side_cursor(self) -> DBAPICursor:
+        if self.dialect.is_async:
+            # the default async cursor fetches the complete result set during execute
+            return self._dbapi_connection.cursor(server_side=True)
+        # hdbcli cursors always fetch result sets from the server in chunks
+        return self.create_default_cursor()
+
+    @override
+    def create_cursor(self) -> DBAPICursor:
+        cursor = self._create_prepared_cursor()
+        if cursor is None:
+            cursor = super().create_cursor()
+        elif self._use_server_side_cursor():
+            # hdbcli cursors always fetch result sets from the server in chunks, a cached
+            # cursor streams results like the cursor created for a server side cursor
+            self._is_server_side = True
+        fetch_size = self.execution_options.get(
+            "hana_fetch_size", self.dialect.fetch_size
+        )
+        if fetch_size:
+            cursor.setfetchsize(fetch_size)
+            cursor.arraysize = fetch_size
+            if self._is_server_side and "max_row_buffer" not in self.execution_options:
+                # buffer no more rows than hdbcli prefetches to keep the memory flat
+                self.execution_options = self.execution_options.union(
+                    {"max_row_buffer": fetch_size}
+                )
+        return cursor
+
+    def _create_prepared_cursor(self) -> DBAPICursor | None:
+        size = self.dialect.prepared_statement_cache_size
+        if not size:
+            return None
+
+        try:
+            info = self._dbapi_connection.info
+        except NotImplementedError:
+            # connections used while the dialect is initialized have no info dictionary
+            return None
+        cache = info.get(_PREPARED_STATEMENTS_KEY)
+        if cache is None:
+            # the info dictionary and therefore the cache is dropped on reconnect
+            cache = info[_PREPARED_STATEMENTS_KEY] = PreparedStatementCache(
+                self._dbapi_connection, size, self.dialect.prepared_statement_stats
+            )
+
+        statement = getattr(self, "unicode_statement", None)
+        if statement is None:
+            return None
+        if self.isddl or _DDL_STATEMENT.match(statement):
+            # prepared statements might refer to the changed objects
+            cache.clear()
+            return None
+
+        compiled = self.compiled
+        if (
+            not isinstance(compiled, compiler.SQLCompiler)
+            or compiled.literal_execute_params
+            or compiled.post_compile_params
+            or compiled.schema_translate_map
+        ):
+            # the executed statement differs from the compiled one
+            return None
+
+        cursor = cache.acquire(statement)
+        if cursor is None:
+            return None
+        return cast("DBAPICursor", PreparedCursor(cache, statement, cursor))
+
     @override
     def fire_sequence(self, seq: Sequence, type_: Integer) -> int:
-        seq = self.identifier_preparer.format_sequence(seq)
-        return self._execute_scalar(f"SELECT {seq}.NEXTVAL FROM DUMMY", type_)
+        sequence = self.identifier_preparer.format_sequence(seq)
+        if (
+            self.dialect.sequence_cache is None
+            or "schema_translate_map" in self.execution_options
+        ):
+            return self._execute_scalar(f"SELECT {sequence}.NEXTVAL FROM DUMMY", type_)
+        return self._next_sequence_value(sequence)
+
+    @override
+    def get_insert_default(self, column: Column[Any]) -> Any:
+        if column.default is not None or not self.dialect.prefetch_identity_values:
+            return super().get_insert_default(column)
+
+        # the autoincrement column without a default, see preexecute_autoincrement_sequences
+        if column.identity is not None and column.identity.always:
+            raise exc.InvalidRequestError(
+                f"Values of the identity column '{column}' are always generated, "
+                "they can not be prefetched"
+            )
+        table = column.table
+        schema = table.schema
+        schema_translate_map = self.execution_options.get("schema_translate_map")
+        if schema_translate_map:
+            schema = schema_translate_map.get(schema, schema)
+
+        key = (schema, table.name)
+        sequence = self.dialect._identity_sequences.get(key)
+        if sequence is None:
+            sequence = self.dialect._identity_sequences[key] = (
+                self.dialect._format_identity_sequence(
+                    schema,
+                    table.name,
+                    lambda params: self._execute_scalar(
+                        _IDENTITY_SEQUENCE_QUERY, None, params
+                    ),
+                )
+            )
+        return self._next_sequence_value(sequence)
+
+    def _next_sequence_value(self, sequence: str) -> int:
+        cache = self.dialect.sequence_cache
+        assert cache is not None
+        values = self._sequence_values.get(sequence)
+        if not values:
+            # an executemany needs one value per parameter set, fetch them at once
+            count = len(self.compiled_parameters) if self.executemany else 1
+            values = self._sequence_values[sequence] = deque(
+                cache.get(
+                    sequence,
+                    count,
+                    lambda size: self.fire_sequence_block(sequence, size),
+                )
+            )
+        return values.popleft()
+
+    def fire_sequence_block(self, sequence: str, count: int) -> list[int]:
+        """Fetch ``count`` values of the given formatted sequence in one round trip."""
+        self.root_connection._cursor_execute(
+            self.cursor, sequence_values_query(sequence), (count,), context=self
+        )
+        return [row[0] for row in self.cursor.fetchall()]
+
+    @override
+    def post_exec(self) -> None:
+        self.dialect._mark_used(self._dbapi_connection)
+        statement = getattr(self, "statement", None)
+        if self.isddl or (statement is not None and _DDL_STATEMENT.match(statement)):
+            # recreated tables get a new identity sequence
+            self.dialect._identity_sequences.clear()
+        elif statement is not None and _SET_TRANSACTION.match(statement):
+            # the isolation level was changed without using set_isolation_level
+            self.dialect._isolation_levels.pop(
+                _connection_key(self._dbapi_connection), None
+            )
+
+    @override
+    def handle_dbapi_exception(self, e: BaseException) -> None:
+        # computed by SQLAlchemy for this exception before the context is notified
+        is_disconnect = self.root_connection._is_disconnect
+        # cached sequence values might belong to another database after a reconnect,
+        # e.g. after a takeover of a system replication
+        if is_disconnect and self.dialect.sequence_cache is not None:
+            self.dialect.sequence_cache.invalidate()
+        # the table of a cached identity sequence might have been recreated
+        if is_disconnect or (
+            isinstance(e, hdbcli.dbapi.Error)
+            and e.errorcode in _OBJECT_NOT_FOUND_ERROR_CODES
+        ):
+            self.dialect._identity_sequences.clear()
 
     @override
     def get_lastrowid(self) -> int:
@@ -569,6 +882,89 @@ class HANAExecutionContext(default.DefaultExecutionContext):
         return res[0]
 
 
+_PREPARED_STATEMENTS_KEY = "hana_prepared_statements"
+
+_DDL_STATEMENT = re.compile(
+    r"\s*(ALTER|COMMENT|CREATE|DROP|RENAME|TRUNCATE)\b", re.IGNORECASE
+)
+
+_IDENTITY_SEQUENCE_QUERY = (
+    "SELECT SEQUENCES.SEQUENCE_NAME FROM SYS.SEQUENCES AS SEQUENCES "
+    "JOIN SYS.TABLES AS TABLES ON SEQUENCES.SCHEMA_NAME=TABLES.SCHEMA_NAME "
+    "WHERE TABLES.SCHEMA_NAME=? AND TABLES.TABLE_NAME=? AND "
+    "LEFT(SEQUENCES.SEQUENCE_NAME, LENGTH('_SYS_SEQUENCE_' || TABLES.TABLE_OID) + 1)"
+    "='_SYS_SEQUENCE_' || TABLES.TABLE_OID || '_'"
+)
+
+_SET_TRANSACTION = re.compile(r"\s*SET\s+TRANSACTION\b", re.IGNORECASE)
+
+# invalid table name, invalid sequence and invalid object name
+_OBJECT_NOT_FOUND_ERROR_CODES = frozenset((259, 313, 397))
+
+
+def _connection_key(connection: object) -> int:
+    # hdbcli connections do not support weak references, therefore per connection state
+    # is kept by id and removed when the connection is created or closed
+    if isinstance(connection, PoolProxiedConnection):
+        connection = connection.dbapi_connection
+    return id(connection)
+
+
+def _without_arguments(
+    type_: type[TypeEngine[Any]],
+) -> Callable[[int | None, int | None], TypeEngine[Any]]:
+    return lambda length, scale: type_()
+
+
+def _with_length(
+    type_: Callable[[int | None], TypeEngine[Any]],
+) -> Callable[[int | None, int | None], TypeEngine[Any]]:
+    return lambda length, scale: type_(length)
+
+
+def _vector_with_length(
+    type_: type[hana_types.REAL_VECTOR[Any]],
+) -> Callable[[int | None, int | None], TypeEngine[Any]]:
+    # vectors without a fixed dimension are reported with a length of 0
+    return lambda length, scale: type_(length or None)
+
+
+# maps the DATA_TYPE_NAME of the catalog to a factory called with LENGTH and SCALE;
+# can be extended to reflect custom types
+ischema_names: dict[str, Callable[[int | None, int | None], TypeEngine[Any]]] = {
+    "TINYINT": _without_arguments(hana_types.TINYINT),
+    "SMALLINT": _without_arguments(hana_types.SMALLINT),
+    "INTEGER": _without_arguments(hana_types.INTEGER),
+    "BIGINT": _without_arguments(hana_types.BIGINT),
+    "DECIMAL": hana_types.DECIMAL,
+    "SMALLDECIMAL": _without_arguments(hana_types.SMALLDECIMAL),
+    "REAL": _without_arguments(hana_types.REAL),
+    "DOUBLE": _without_arguments(hana_types.DOUBLE),
+    "FLOAT": _with_length(hana_types.FLOAT),
+    "BOOLEAN": _without_arguments(hana_types.BOOLEAN),
+    "VARCHAR": _with_length(hana_types.VARCHAR),
+    "NVARCHAR": _with_length(hana_types.NVARCHAR),
+    "ALPHANUM": _with_length(hana_types.ALPHANUM),
+    "SHORTTEXT": _with_length(hana_types.NVARCHAR),
+    "CHAR": _with_length(hana_types.CHAR),
+    "NCHAR": _with_length(hana_types.NCHAR),
+    "VARBINARY": _with_length(hana_types.VARBINARY),
+    "BLOB": _without_arguments(hana_types.BLOB),
+    "CLOB": _without_arguments(hana_types.CLOB),
+    "NCLOB": _without_arguments(hana_types.NCLOB),
+    "TEXT": _without_arguments(types.TEXT),
+    "BINTEXT": _without_arguments(hana_types.BLOB),
+    "DATE": _without_arguments(hana_types.DATE),
+    "TIME": _without_arguments(hana_types.TIME),
+    "SECONDDATE": _without_arguments(hana_types.SECONDDATE),
+    "TIMESTAMP": _without_arguments(hana_types.TIMESTAMP),
+    "ST_GEOMETRY": _without_arguments(hana_types.ST_GEOMETRY),
+    "ST_POINT": _without_arguments(hana_types.ST_POINT),
+    "REAL_VECTOR": _vector_with_length(hana_types.REAL_VECTOR),
+    "HALF_VECTOR": _vector_with_length(hana_types.HALF_VECTOR),
+}
+
+
 class HANAInspector(reflection.Inspector):
     dialect: HANAHDBCLIDialect
 
@@ -581,8 +977,49 @@ class HANAInspector(reflection.Inspector):
                 info_cache=self.info_cache,
             )
 
+    def reflect_schemas(
+        self,
+        schemas: Iterable[str | None],
+        metadata: MetaData | None = None,
+        *,
+        max_workers: int = 4,
+        views: bool = False,
+    ) -> MetaData:
+        """Reflect the tables of multiple schemas in parallel into a single ``MetaData``.
+
+        Each schema is reflected by a worker thread on its own pooled connection and with
+        its own reflection cache, the reflected tables are merged into ``metadata``.
+        Foreign keys are resolved between the tables of the given schemas only, tables of
+        other schemas are not reflected.
+        """
+        if not isinstance(self.bind, Engine):
+            raise exc.ArgumentError(
+                "reflect_schemas requires an inspector bound to an engine"
+            )
+        if max_workers < 1:
+            raise exc.ArgumentError("max_workers must be greater than 0")
+        engine = self.bind
+
+        def reflect_schema(schema: str | None) -> MetaData:
+            schema_metadata = MetaData()
+            with engine.connect() as conn:
+                schema_metadata.reflect(
+                    conn, schema=schema, views=views, resolve_fks=False
+                )
+            return schema_metadata
+
+        if metadata is None:
+            metadata = MetaData()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for schema_metadata in executor.map(reflect_schema, schemas):
+                for key, table in schema_metadata.tables.items():
+                    if key not in metadata.tables:
+                        table.to_metadata(metadata)
+        return metadata
+
 
 class HANAHDBCLIDialect(default.DefaultDialect):
+    # pylint: disable=too-many-instance-attributes
     name = "hana"
     driver = "hdbcli"
     default_paramstyle = "qmark"
@@ -616,6 +1053,8 @@ class HANAHDBCLIDialect(default.DefaultDialect):
     supports_sane_multi_rowcount = False
     supports_sane_rowcount = False
     supports_schemas = True
+    supports_server_side_cursors = True
+    supports_vector_indexes = False
     supports_sequences = True
     supports_statement_cache = True
     supports_unicode_binds = True
@@ -633,14 +1072,7 @@ class HANAHDBCLIDialect(default.DefaultDialect):
         hana_types.SECONDDATE: hana_types.SECONDDATE,
     }
 
-    types_with_length = [
-        hana_types.VARCHAR,
-        hana_types.NVARCHAR,
-        hana_types.VARBINARY,
-        hana_types.CHAR,
-        hana_types.NCHAR,
-        hana_types.ALPHANUM,
-    ]
+    ischema_names = ischema_names
 
     isolation_level = None
     default_schema_name: str  # this is always set for us
@@ -651,15 +1083,68 @@ class HANAHDBCLIDialect(default.DefaultDialect):
         use_native_boolean: bool = True,
         json_serializer: Callable[[Any], str] | None = None,
         json_deserializer: Callable[[str], Any] | None = None,
-        vector_output_type: Literal["list", "tuple", "memoryview"] = "list",
+        vector_output_type: Literal["list", "tuple", "memoryview", "numpy"] = "list",
+        sequence_cache_size: int | None = None,
+        fetch_size: int | None = None,
+        identifier_cache_size: int = 10_000,
+        reflection_cache_dir: str | os.PathLike[str] | None = None,
+        prepared_statement_cache_size: int | None = None,
+        ping_idle_threshold: float = 0,
+        prefetch_identity_values: bool = False,
         **kw: Any,
     ) -> None:
         super().__init__(**kw)
+        if prefetch_identity_values and not sequence_cache_size:
+            raise exc.ArgumentError(
+                "prefetch_identity_values requires sequence_cache_size"
+            )
+        if fetch_size is not None and fetch_size < 1:
+            raise exc.ArgumentError("fetch_size must be greater than 0")
+        if ping_idle_threshold < 0:
+            raise exc.ArgumentError("ping_idle_threshold must not be negative")
+        if (
+            prepared_statement_cache_size is not None
+            and prepared_statement_cache_size < 1
+        ):
+            raise exc.ArgumentError(
+                "prepared_statement_cache_size must be greater than 0"
+            )
+        if identifier_cache_size < 0:
+            raise exc.ArgumentError("identifier_cache_size must not be negative")
         self.isolation_level = isolation_level
         self.supports_native_boolean = use_native_boolean
         self._json_serializer = json_serializer
         self._json_deserializer = json_deserializer
+        if vector_output_type == "numpy" and not importlib.util.find_spec("numpy"):
+            raise exc.ArgumentError("numpy is required for vector_output_type 'numpy'")
         self.vector_output_type = vector_output_type
+        self.sequence_cache = (
+            SequenceCache(sequence_cache_size) if sequence_cache_size else None
+        )
+        self.fetch_size = fetch_size
+        self._normalize_name_cache: functools._lru_cache_wrapper[str] | None = None
+        self._denormalize_name_cache: functools._lru_cache_wrapper[str] | None = None
+        if identifier_cache_size:
+            cache = functools.lru_cache(maxsize=identifier_cache_size)
+            self._normalize_name_cache = cache(self._normalize_name)
+            self._denormalize_name_cache = cache(self._denormalize_name)
+        self.reflection_cache = (
+            ReflectionSnapshotCache(reflection_cache_dir)
+            if reflection_cache_dir is not None
+            else None
+        )
+        self.prepared_statement_cache_size = prepared_statement_cache_size
+        self.prepared_statement_stats = PreparedStatementStats()
+        self.ping_idle_threshold = ping_idle_threshold
+        self._last_used: dict[int, float] = {}
+        self._isolation_levels: dict[int, str] = {}
+        self.prefetch_identity_values = prefetch_identity_values
+        if prefetch_identity_values:
+            # SQLAlchemy binds the autoincrement column and calls get_insert_default
+            # instead of fetching CURRENT_IDENTITY_VALUE after the insert
+            self.postfetch_lastrowid = False
+            self.preexecute_autoincrement_sequences = True
+        self._identity_sequences: dict[tuple[str | None, str], str] = {}
 
     @classmethod
     @override
@@ -688,16 +1173,66 @@ class HANAHDBCLIDialect(default.DefaultDialect):
                 "Explicit vectoroutputtype is not supported, "
                 "use the vector_output_type kwarg instead"
             )
-        kwargs["vectoroutputtype"] = self.vector_output_type
+        # numpy arrays are created from the memoryview by REAL_VECTOR
+        kwargs["vectoroutputtype"] = (
+            "memoryview"
+            if self.vector_output_type == "numpy"
+            else self.vector_output_type
+        )
 
         return (), kwargs
 
     @override
     def connect(self, *args: Any, **kw: Any) -> DBAPIConnection:
         connection = super().connect(*args, **kw)
+        self._forget_connection(connection)
         connection.setautocommit(False)
         return connection
 
+    @override
+    def do_ping(self, dbapi_connection: DBAPIConnection) -> bool:
+        if not cast(hdbcli.dbapi.Connection, dbapi_connection).isconnected():
+            return False
+        if self.ping_idle_threshold:
+            last_used = self._last_used.get(_connection_key(dbapi_connection))
+            if (
+                last_used is not None
+                and time.monotonic() - last_used < self.ping_idle_threshold
+            ):
+                # the connection was used successfully a moment ago
+                return True
+        super().do_ping(dbapi_connection)
+        self._mark_used(dbapi_connection)
+        return True
+
+    def _mark_used(self, connection: PoolProxiedConnection | DBAPIConnection) -> None:
+        """Record a successful round trip of the given connection."""
+        if self.ping_idle_threshold:
+            self._last_used[_connection_key(connection)] = time.monotonic()
+
+    def _forget_connection(
+        self, connection: PoolProxiedConnection | DBAPIConnection
+    ) -> None:
+        """Remove the tracked state of the given connection."""
+        key = _connection_key(connection)
+        self._last_used.pop(key, None)
+        self._isolation_levels.pop(key, None)
+
+    @override
+    def do_commit(self, dbapi_connection: PoolProxiedConnection) -> None:
+        super().do_commit(dbapi_connection)
+        self._mark_used(dbapi_connection)
+
+    @override
+    def do_rollback(self, dbapi_connection: PoolProxiedConnection) -> None:
+        super().do_rollback(dbapi_connection)
+        self._mark_used(dbapi_connection)
+
+    @override
+    def do_close(self, dbapi_connection: DBAPIConnection) -> None:
+        self._forget_connection(dbapi_connection)
+        super().do_close(dbapi_connection)
+
     @override
     def on_connect(self) -> Callable[[DBAPIConnection], None] | None:
         if self.isolation_level is not None:
@@ -735,30 +1270,53 @@ class HANAHDBCLIDialect(default.DefaultDialect):
         self, dbapi_connection: DBAPIConnection, level: str
     ) -> None:
         hana_connection = cast(hdbcli.dbapi.Connection, dbapi_connection)
-        if level == "AUTOCOMMIT":
-            hana_connection.setautocommit(True)
-        else:
-            hana_connection.setautocommit(False)
+        autocommit = level == "AUTOCOMMIT"
+        if hana_connection.getautocommit() != autocommit:
+            hana_connection.setautocommit(autocommit)
+        if autocommit:
+            return
 
-            if level not in self._isolation_lookup:
-                lookups = ", ".join(self._isolation_lookup)
-                raise exc.ArgumentError(
-                    f"Invalid value '{level}' for isolation_level. "
-                    f"Valid isolation levels for {self.name} are {lookups}"
-                )
-            with hana_connection.cursor() as cursor:
-                cursor.execute(f"SET TRANSACTION ISOLATION LEVEL {level}")
+        if level not in self._isolation_lookup:
+            lookups = ", ".join(self._isolation_lookup)
+            raise exc.ArgumentError(
+                f"Invalid value '{level}' for isolation_level. "
+                f"Valid isolation levels for {self.name} are {lookups}"
+            )
+        key = _connection_key(dbapi_connection)
+        if self._isolation_levels.get(key) == level:
+            # the isolation level of the session is still set
+            return
+        with hana_connection.cursor() as cursor:
+            cursor.execute(f"SET TRANSACTION ISOLATION LEVEL {level}")
+        self._isolation_levels[key] = level
 
     @override
     def get_isolation_level(  # type: ignore[override]
         self, dbapi_connection: hdbcli.dbapi.Connection
     ) -> str:
+        key = _connection_key(dbapi_connection)
+        level = self._isolation_levels.get(key)
+        if level is not None:
+            return level
+
         with closing(dbapi_connection.cursor()) as cursor:
             cursor.execute("SELECT CURRENT_TRANSACTION_ISOLATION_LEVEL FROM DUMMY")
             result = cursor.fetchone()
 
         assert result, "no current transaction isolation level found"
-        return cast(str, result[0])
+        level = self._isolation_levels[key] = cast(str, result[0])
+        return level
+
+    @override
+    def initialize(self, connection: Connection) -> None:
+        super().initialize(connection)
+        # vector indexes are only available on SAP HANA Cloud
+        self.supports_vector_indexes = bool(
+            connection.exec_driver_sql(
+                "SELECT COUNT(*) FROM SYS.VIEWS "
+                "WHERE SCHEMA_NAME='SYS' AND VIEW_NAME='VECTOR_INDEXES'"
+            ).scalar()
+        )
 
     @override
     def _get_server_version_info(self, connection: Connection) -> tuple[int, ...]:
@@ -790,7 +1348,12 @@ class HANAHDBCLIDialect(default.DefaultDialect):
     def normalize_name(self, name: str | None) -> str:
         if name is None:
             return None  # type: ignore[return-value]
+        # quoted names are equal to their plain string, so they must not be cached
+        if self._normalize_name_cache is None or isinstance(name, quoted_name):
+            return self._normalize_name(name)
+        return self._normalize_name_cache(name)
 
+    def _normalize_name(self, name: str) -> str:
         if name.upper() == name and not self.identifier_preparer._requires_quotes(
             name.lower()
         ):
@@ -805,13 +1368,34 @@ class HANAHDBCLIDialect(default.DefaultDialect):
     def denormalize_name(self, name: str | None) -> str:
         if name is None:
             return None  # type: ignore[return-value]
+        if self._denormalize_name_cache is None or isinstance(name, quoted_name):
+            return self._denormalize_name(name)
+        return self._denormalize_name_cache(name)
 
+    def _denormalize_name(self, name: str) -> str:
         if name.lower() == name and not self.identifier_preparer._requires_quotes(
             name.lower()
         ):
             name = name.upper()
         return name
 
+    def identifier_cache_info(self) -> dict[str, functools._CacheInfo]:
+        """Return the hit and miss counters of the identifier caches.
+
+        The result is empty if the caches are disabled.
+        """
+        if self._normalize_name_cache is None or self._denormalize_name_cache is None:
+            return {}
+        return {
+            "normalize_name": self._normalize_name_cache.cache_info(),
+            "denormalize_name": self._denormalize_name_cache.cache_info(),
+        }
+
+    def prepared_statement_cache_info(self) -> dict[str, int]:
+        """Return the hit and miss counters of the prepared statement caches."""
+        stats = self.prepared_statement_stats
+        return {"hits": stats.hits, "misses": stats.misses}
+
     @override
     @reflection.cache
     def has_table(
@@ -901,6 +1485,7 @@ class HANAHDBCLIDialect(default.DefaultDialect):
 
     @override
     @reflection.cache
+    @snapshot_names
     def get_table_names(
         self, connection: Connection, schema: str | None = None, **kw: Any
     ) -> list[str]:
@@ -919,6 +1504,7 @@ class HANAHDBCLIDialect(default.DefaultDialect):
 
     @override
     @reflection.cache
+    @snapshot_names
     def get_temp_table_names(
         self, connection: Connection, schema: str | None = None, **kw: Any
     ) -> list[str]:
@@ -937,6 +1523,7 @@ class HANAHDBCLIDialect(default.DefaultDialect):
 
     @override
     @reflection.cache
+    @snapshot_names
     def get_view_names(
         self, connection: Connection, schema: str | None = None, **kw: Any
     ) -> list[str]:
@@ -976,41 +1563,153 @@ class HANAHDBCLIDialect(default.DefaultDialect):
             raise exc.NoSuchTableError()
         return result
 
-    @override
     @reflection.cache
-    def get_columns(
+    def _get_all_objects(
         self,
         connection: Connection,
-        table_name: str,
         schema: str | None = None,
+        *,
+        scope: reflection.ObjectScope,
+        kind: reflection.ObjectKind,
+        filter_names: tuple[str, ...] | None = None,
         **kw: Any,
-    ) -> list[ReflectedColumn]:
+    ) -> dict[str, str]:
+        # returns a mapping of the denormalized object names to the names used in
+        # the result keys of the get_multi_* methods
+        queries = []
+        if reflection.ObjectKind.TABLE in kind:
+            query = (
+                "SELECT SCHEMA_NAME, TABLE_NAME AS OBJECT_NAME FROM SYS.TABLES "
+                "WHERE IS_USER_DEFINED_TYPE='FALSE'"
+            )
+            if reflection.ObjectScope.ANY not in scope:
+                is_temporary = reflection.ObjectScope.TEMPORARY in scope
+                query += f" AND IS_TEMPORARY='{'TRUE' if is_temporary else 'FALSE'}'"
+            queries.append(query)
+        if (
+            reflection.ObjectKind.VIEW in kind
+            and reflection.ObjectScope.DEFAULT in scope
+        ):
+            queries.append(
+                "SELECT SCHEMA_NAME, VIEW_NAME AS OBJECT_NAME FROM SYS.VIEWS"
+            )
+        if not queries:
+            return {}
+
+        result = connection.execute(
+            self._multi_reflection_statement(
+                f"SELECT OBJECT_NAME FROM ({' UNION ALL '.join(queries)}) AS OBJECTS "
+                "WHERE SCHEMA_NAME=:schema {filter_names}",
+                schema,
+                filter_names,
+                name_column="OBJECT_NAME",
+            )
+        )
+
+        if filter_names:
+            names = {self.denormalize_name(name): name for name in filter_names}
+            return {row[0]: names[row[0]] for row in result if row[0] in names}
+        return {row[0]: self.normalize_name(row[0]) for row in result}
+
+    def _multi_reflection_statement(
+        self,
+        query: str,
+        schema: str | None,
+        filter_names: Collection[str] | None,
+        name_column: str = "TABLE_NAME",
+    ) -> TextClause:
         schema_name = schema or self.default_schema_name
-        if not self.has_table(connection, table_name, schema_name, **kw):
-            raise exc.NoSuchTableError()
+        filter_clause = f"AND {name_column} IN :filter_names" if filter_names else ""
+        statement = sql.text(query.format(filter_names=filter_clause)).bindparams(
+            schema=self.denormalize_name(schema_name)
+        )
+        if filter_names:
+            statement = statement.bindparams(
+                sql.bindparam(
+                    "filter_names",
+                    [self.denormalize_name(name) for name in filter_names],
+                    expanding=True,
+                )
+            )
+        return statement
+
+    def _get_multi_rows(
+        self,
+        connection: Connection,
+        query: str,
+        schema: str | None,
+        scope: reflection.ObjectScope,
+        kind: reflection.ObjectKind,
+        filter_names: Collection[str] | None,
+        name_column: str = "TABLE_NAME",
+        **kw: Any,
+    ) -> Iterable[tuple[TableKey, list[tuple[Any, ...]]]]:
+        # executes a schema wide catalog query and groups the returned rows by the first
+        # column, which needs to be the table name; the table name is removed from the rows
+        objects = self._get_all_objects(
+            connection,
+            schema,
+            scope=scope,
+            kind=kind,
+            filter_names=tuple(filter_names) if filter_names else None,
+            **kw,
+        )
+        if not objects:
+            return []
 
+        result = connection.execute(
+            self._multi_reflection_statement(query, schema, filter_names, name_column)
+        )
+        rows: dict[str, list[tuple[Any, ...]]] = {}
+        for row in result:
+            rows.setdefault(row[0], []).append(row[1:])
+        return [
+            ((schema, name), rows.get(table, [])) for table, name in objects.items()
+        ]
+
+    def _get_table_rows(
+        self,
+        connection: Connection,
+        columns: str,
+        source: str,
+        order_by: str,
+        table_name: str,
+        schema: str | None,
+    ) -> list[tuple[Any, ...]]:
+        # executes a catalog query for a single table, joined with the table or view itself,
+        # so that a missing table is detected without a separate has_table statement;
+        # the source needs to filter by the :schema and :table parameters
+        schema_name = schema or self.default_schema_name
         result = connection.execute(
             sql.text(
-                """SELECT COLUMN_NAME, DATA_TYPE_NAME, DEFAULT_VALUE, IS_NULLABLE, LENGTH, SCALE,
-                    COMMENTS, GENERATED_ALWAYS_AS, GENERATION_TYPE FROM (
-                        SELECT SCHEMA_NAME, TABLE_NAME, COLUMN_NAME, POSITION, DATA_TYPE_NAME,
-                        DEFAULT_VALUE, IS_NULLABLE, LENGTH, SCALE, COMMENTS,
-                        GENERATED_ALWAYS_AS, GENERATION_TYPE
-                        FROM SYS.TABLE_COLUMNS UNION ALL
-                        SELECT SCHEMA_NAME, VIEW_NAME AS TABLE_NAME, COLUMN_NAME, POSITION,
-                        DATA_TYPE_NAME, DEFAULT_VALUE, IS_NULLABLE, LENGTH, SCALE,
-                        COMMENTS, GENERATED_ALWAYS_AS, GENERATION_TYPE
-                        FROM SYS.VIEW_COLUMNS )
-                    AS COLUMS WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table ORDER BY POSITION
-                """
+                "SELECT RESULT.* FROM ("
+                "SELECT TABLE_NAME FROM SYS.TABLES "
+                "WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table "
+                "UNION ALL "
+                "SELECT VIEW_NAME FROM SYS.VIEWS "
+                "WHERE SCHEMA_NAME=:schema AND VIEW_NAME=:table"
+                ") AS OBJECTS LEFT OUTER JOIN ("
+                f"SELECT ROW_NUMBER() OVER (ORDER BY {order_by}) AS ROW_NUM, {columns} "
+                f"FROM {source}"
+                ") AS RESULT ON 1=1 ORDER BY RESULT.ROW_NUM"
             ).bindparams(
                 schema=self.denormalize_name(schema_name),
                 table=self.denormalize_name(table_name),
             )
         )
-
+        rows = result.fetchall()
+        if not rows:
+            raise exc.NoSuchTableError(table_name)
+        # the table exists, but the query returned no rows
+        if rows[0][0] is None:
+            return []
+        return [tuple(row[1:]) for row in rows]
+
+    def _reflect_columns(
+        self, rows: Iterable[tuple[Any, ...]]
+    ) -> list[ReflectedColumn]:
         columns: list[ReflectedColumn] = []
-        for row in result.fetchall():
+        for row in rows:
             column = {
                 "name": self.normalize_name(row[0]),
                 "default": row[2],
@@ -1023,73 +1722,26 @@ class HANAHDBCLIDialect(default.DefaultDialect):
             elif row[8] == "ALWAYS AS":  # COL GENERATED ALWAYS AS EXPR
                 column["computed"] = {"sqltext": row[7], "persisted": True}
 
-            if hasattr(hana_types, row[1]):
-                column["type"] = getattr(hana_types, row[1])
-            elif hasattr(types, row[1]):
-                column["type"] = getattr(types, row[1])
+            type_factory = self.ischema_names.get(row[1])
+            if type_factory is not None:
+                column["type"] = type_factory(row[4], row[5])
             else:
                 util.warn(  # noqa: FTP032, FTP035
                     f"Did not recognize type '{row[1]}' of column '{column['name']}'"
                 )
                 column["type"] = types.NULLTYPE
 
-            if column["type"] == hana_types.DECIMAL:
-                column["type"] = hana_types.DECIMAL(row[4], row[5])
-            elif column["type"] == hana_types.FLOAT:
-                column["type"] = hana_types.FLOAT(row[4])
-            elif column["type"] == hana_types.REAL_VECTOR:
-                column["type"] = hana_types.REAL_VECTOR(row[4] if row[4] > 0 else None)
-            elif column["type"] in self.types_with_length:
-                column["type"] = column["type"](row[4])
-
             columns.append(cast("ReflectedColumn", column))
 
         return columns
 
-    @override
-    @reflection.cache
-    def get_sequence_names(
-        self, connection: Connection, schema: str | None = None, **kw: Any
-    ) -> list[str]:
-        schema_name = schema or self.default_schema_name
-
-        result = connection.execute(
-            sql.text(
-                "SELECT SEQUENCE_NAME FROM SYS.SEQUENCES "
-                "WHERE SCHEMA_NAME=:schema ORDER BY SEQUENCE_NAME"
-            ).bindparams(schema=self.denormalize_name(schema_name))
-        )
-        return [self.normalize_name(row[0]) for row in result]
-
-    @override
-    @reflection.cache
-    def get_foreign_keys(
-        self,
-        connection: Connection,
-        table_name: str,
-        schema: str | None = None,
-        **kw: Any,
+    def _reflect_foreign_keys(
+        self, rows: Iterable[tuple[Any, ...]]
     ) -> list[ReflectedForeignKeyConstraint]:
-        schema_name = schema or self.default_schema_name
-        if not self.has_table(connection, table_name, schema_name, **kw):
-            raise exc.NoSuchTableError()
-
-        result = connection.execute(
-            sql.text(
-                "SELECT CONSTRAINT_NAME, COLUMN_NAME, REFERENCED_SCHEMA_NAME, "
-                "REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME, UPDATE_RULE, DELETE_RULE "
-                "FROM SYS.REFERENTIAL_CONSTRAINTS "
-                "WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table "
-                "ORDER BY CONSTRAINT_NAME, POSITION"
-            ).bindparams(
-                schema=self.denormalize_name(schema_name),
-                table=self.denormalize_name(table_name),
-            )
-        )
         foreign_keys: dict[str, ReflectedForeignKeyConstraint] = {}
         foreign_keys_list: list[ReflectedForeignKeyConstraint] = []
 
-        for row in result:
+        for row in rows:
             foreign_key_name = self.normalize_name(row[0])
 
             if foreign_key_name in foreign_keys:
@@ -1120,33 +1772,46 @@ class HANAHDBCLIDialect(default.DefaultDialect):
             ),
         )
 
-    @override
-    @reflection.cache
-    def get_indexes(
-        self,
-        connection: Connection,
-        table_name: str,
-        schema: str | None = None,
-        **kw: Any,
-    ) -> list[ReflectedIndex]:
-        schema_name = schema or self.default_schema_name
-        if not self.has_table(connection, table_name, schema_name, **kw):
-            raise exc.NoSuchTableError()
-
-        result = connection.execute(
-            sql.text(
-                'SELECT "INDEX_NAME", "COLUMN_NAME", "CONSTRAINT" '
-                "FROM SYS.INDEX_COLUMNS "
-                "WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table "
-                "ORDER BY POSITION"
-            ).bindparams(
-                schema=self.denormalize_name(schema_name),
-                table=self.denormalize_name(table_name),
+    def _index_columns_query(
+        self, where: str, order_by: str, with_table_name: bool = False
+    ) -> str:
+        columns, source = self._index_columns_source(with_table_name)
+        return f"SELECT {columns} FROM {source} WHERE {where} ORDER BY {order_by}"
+
+    def _index_columns_source(self, with_table_name: bool = False) -> tuple[str, str]:
+        columns = 'INDEX_COLUMNS.INDEX_NAME, INDEX_COLUMNS.COLUMN_NAME, INDEX_COLUMNS."CONSTRAINT"'
+        if with_table_name:
+            columns = f"INDEX_COLUMNS.TABLE_NAME, {columns}"
+        source = "SYS.INDEX_COLUMNS AS INDEX_COLUMNS"
+        if self.supports_vector_indexes:
+            columns += (
+                ", VECTOR_INDEXES.INDEX_TYPE, VECTOR_INDEXES.SIMILARITY_FUNCTION, "
+                "VECTOR_INDEXES.BUILD_CONFIGURATION, VECTOR_INDEXES.SEARCH_CONFIGURATION"
             )
-        )
+            source += (
+                " LEFT JOIN SYS.VECTOR_INDEXES AS VECTOR_INDEXES "
+                "ON VECTOR_INDEXES.SCHEMA_NAME=INDEX_COLUMNS.SCHEMA_NAME "
+                "AND VECTOR_INDEXES.TABLE_NAME=INDEX_COLUMNS.TABLE_NAME "
+                "AND VECTOR_INDEXES.INDEX_NAME=INDEX_COLUMNS.INDEX_NAME"
+            )
+        else:
+            columns += (
+                ", NULL AS INDEX_TYPE, NULL AS SIMILARITY_FUNCTION, "
+                "NULL AS BUILD_CONFIGURATION, NULL AS SEARCH_CONFIGURATION"
+            )
+        return columns, source
 
+    def _reflect_indexes(self, rows: Iterable[tuple[Any, ...]]) -> list[ReflectedIndex]:
         indexes: dict[str, ReflectedIndex] = {}
-        for name, column, constraint in result.fetchall():
+        for (
+            name,
+            column,
+            constraint,
+            index_type,
+            similarity_function,
+            build_configuration,
+            search_configuration,
+        ) in rows:
             if constraint == "PRIMARY KEY":
                 continue
 
@@ -1164,6 +1829,21 @@ class HANAHDBCLIDialect(default.DefaultDialect):
                 if constraint is not None:
                     indexes[name]["unique"] = "UNIQUE" in constraint.upper()
 
+                if index_type is not None:
+                    dialect_options = {
+                        "hana_index_type": index_type,
+                        "hana_similarity_function": similarity_function,
+                    }
+                    if build_configuration:
+                        dialect_options["hana_build_configuration"] = (
+                            build_configuration
+                        )
+                    if search_configuration:
+                        dialect_options["hana_search_configuration"] = (
+                            search_configuration
+                        )
+                    indexes[name]["dialect_options"] = dialect_options
+
             else:
                 indexes[name]["column_names"].append(column)
 
@@ -1172,34 +1852,12 @@ class HANAHDBCLIDialect(default.DefaultDialect):
             key=lambda index: (index["name"] is not None, index["name"]),
         )
 
-    @override
-    @reflection.cache
-    def get_pk_constraint(
-        self,
-        connection: Connection,
-        table_name: str,
-        schema: str | None = None,
-        **kw: Any,
+    def _reflect_pk_constraint(
+        self, rows: Iterable[tuple[Any, ...]]
     ) -> ReflectedPrimaryKeyConstraint:
-        schema_name = schema or self.default_schema_name
-        if not self.has_table(connection, table_name, schema_name, **kw):
-            raise exc.NoSuchTableError()
-
-        result = connection.execute(
-            sql.text(
-                "SELECT CONSTRAINT_NAME, COLUMN_NAME FROM SYS.CONSTRAINTS "
-                "WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table AND "
-                "IS_PRIMARY_KEY='TRUE' "
-                "ORDER BY POSITION"
-            ).bindparams(
-                schema=self.denormalize_name(schema_name),
-                table=self.denormalize_name(table_name),
-            )
-        )
-
         constraint_name = None
         constrained_columns = []
-        for row in result.fetchall():
+        for row in rows:
             constraint_name = row[0]
             constrained_columns.append(self.normalize_name(row[1]))
 
@@ -1208,34 +1866,12 @@ class HANAHDBCLIDialect(default.DefaultDialect):
             "constrained_columns": constrained_columns,
         }
 
-    @override
-    @reflection.cache
-    def get_unique_constraints(
-        self,
-        connection: Connection,
-        table_name: str,
-        schema: str | None = None,
-        **kw: Any,
+    def _reflect_unique_constraints(
+        self, rows: Iterable[tuple[Any, ...]]
     ) -> list[ReflectedUniqueConstraint]:
-        schema_name = schema or self.default_schema_name
-        if not self.has_table(connection, table_name, schema_name, **kw):
-            raise exc.NoSuchTableError()
-
-        result = connection.execute(
-            sql.text(
-                "SELECT CONSTRAINT_NAME, COLUMN_NAME FROM SYS.CONSTRAINTS "
-                "WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table AND "
-                "IS_UNIQUE_KEY='TRUE' AND IS_PRIMARY_KEY='FALSE' "
-                "ORDER BY CONSTRAINT_NAME, POSITION"
-            ).bindparams(
-                schema=self.denormalize_name(schema_name),
-                table=self.denormalize_name(table_name),
-            )
-        )
-
         constraints: list[ReflectedUniqueConstraint] = []
         parsing_constraint = None
-        for constraint_name, column_name in result.fetchall():
+        for constraint_name, column_name in rows:
             if parsing_constraint != constraint_name:
                 # Start with new constraint
                 parsing_constraint = constraint_name
@@ -1261,33 +1897,12 @@ class HANAHDBCLIDialect(default.DefaultDialect):
             key=lambda constraint: (constraint["name"] is not None, constraint["name"]),
         )
 
-    @override
-    @reflection.cache
-    def get_check_constraints(
-        self,
-        connection: Connection,
-        table_name: str,
-        schema: str | None = None,
-        **kw: Any,
+    def _reflect_check_constraints(
+        self, rows: Iterable[tuple[Any, ...]]
     ) -> list[ReflectedCheckConstraint]:
-        schema_name = schema or self.default_schema_name
-        if not self.has_table(connection, table_name, schema_name, **kw):
-            raise exc.NoSuchTableError()
-
-        result = connection.execute(
-            sql.text(
-                "SELECT CONSTRAINT_NAME, CHECK_CONDITION FROM SYS.CONSTRAINTS "
-                "WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table AND "
-                "CHECK_CONDITION IS NOT NULL"
-            ).bindparams(
-                schema=self.denormalize_name(schema_name),
-                table=self.denormalize_name(table_name),
-            )
-        )
-
         check_conditions: list[ReflectedCheckConstraint] = []
 
-        for row in result.fetchall():
+        for row in rows:
             check_condition: ReflectedCheckConstraint = {
                 "name": self.normalize_name(row[0]),
                 "sqltext": self.normalize_name(row[1]),
@@ -1303,6 +1918,322 @@ class HANAHDBCLIDialect(default.DefaultDialect):
             ),
         )
 
+    def _reflect_table_comment(
+        self, rows: Iterable[tuple[Any, ...]]
+    ) -> ReflectedTableComment:
+        row = next(iter(rows), None)
+        return {"text": row[0] if row else None}
+
+    @override
+    @reflection.cache
+    def get_columns(
+        self,
+        connection: Connection,
+        table_name: str,
+        schema: str | None = None,
+        **kw: Any,
+    ) -> list[ReflectedColumn]:
+        rows = self._get_table_rows(
+            connection,
+            "COLUMN_NAME, DATA_TYPE_NAME, DEFAULT_VALUE, IS_NULLABLE, LENGTH, SCALE, "
+            "COMMENTS, GENERATED_ALWAYS_AS, GENERATION_TYPE",
+            """(
+                SELECT SCHEMA_NAME, TABLE_NAME, COLUMN_NAME, POSITION, DATA_TYPE_NAME,
+                DEFAULT_VALUE, IS_NULLABLE, LENGTH, SCALE, COMMENTS,
+                GENERATED_ALWAYS_AS, GENERATION_TYPE
+                FROM SYS.TABLE_COLUMNS UNION ALL
+                SELECT SCHEMA_NAME, VIEW_NAME AS TABLE_NAME, COLUMN_NAME, POSITION,
+                DATA_TYPE_NAME, DEFAULT_VALUE, IS_NULLABLE, LENGTH, SCALE,
+                COMMENTS, GENERATED_ALWAYS_AS, GENERATION_TYPE
+                FROM SYS.VIEW_COLUMNS
+            ) AS COLUMS WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table""",
+            "POSITION",
+            table_name,
+            schema,
+        )
+        return self._reflect_columns(rows)
+
+    @override
+    @snapshot_multi
+    def get_multi_columns(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None = None,
+        filter_names: Collection[str] | None = None,
+        scope: reflection.ObjectScope = reflection.ObjectScope.DEFAULT,
+        kind: reflection.ObjectKind = reflection.ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[tuple[TableKey, list[ReflectedColumn]]]:
+        data = self._get_multi_rows(
+            connection,
+            """SELECT TABLE_NAME, COLUMN_NAME, DATA_TYPE_NAME, DEFAULT_VALUE, IS_NULLABLE,
+                LENGTH, SCALE, COMMENTS, GENERATED_ALWAYS_AS, GENERATION_TYPE FROM (
+                    SELECT SCHEMA_NAME, TABLE_NAME, COLUMN_NAME, POSITION, DATA_TYPE_NAME,
+                    DEFAULT_VALUE, IS_NULLABLE, LENGTH, SCALE, COMMENTS,
+                    GENERATED_ALWAYS_AS, GENERATION_TYPE
+                    FROM SYS.TABLE_COLUMNS UNION ALL
+                    SELECT SCHEMA_NAME, VIEW_NAME AS TABLE_NAME, COLUMN_NAME, POSITION,
+                    DATA_TYPE_NAME, DEFAULT_VALUE, IS_NULLABLE, LENGTH, SCALE,
+                    COMMENTS, GENERATED_ALWAYS_AS, GENERATION_TYPE
+                    FROM SYS.VIEW_COLUMNS )
+                AS COLUMS WHERE SCHEMA_NAME=:schema {filter_names}
+                ORDER BY TABLE_NAME, POSITION
+            """,
+            schema,
+            scope,
+            kind,
+            filter_names,
+            **kw,
+        )
+        return [(key, self._reflect_columns(rows)) for key, rows in data]
+
+    @override
+    @reflection.cache
+    def get_sequence_names(
+        self, connection: Connection, schema: str | None = None, **kw: Any
+    ) -> list[str]:
+        schema_name = schema or self.default_schema_name
+
+        result = connection.execute(
+            sql.text(
+                "SELECT SEQUENCE_NAME FROM SYS.SEQUENCES "
+                "WHERE SCHEMA_NAME=:schema ORDER BY SEQUENCE_NAME"
+            ).bindparams(schema=self.denormalize_name(schema_name))
+        )
+        return [self.normalize_name(row[0]) for row in result]
+
+    @override
+    @reflection.cache
+    def get_foreign_keys(
+        self,
+        connection: Connection,
+        table_name: str,
+        schema: str | None = None,
+        **kw: Any,
+    ) -> list[ReflectedForeignKeyConstraint]:
+        rows = self._get_table_rows(
+            connection,
+            "CONSTRAINT_NAME, COLUMN_NAME, REFERENCED_SCHEMA_NAME, "
+            "REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME, UPDATE_RULE, DELETE_RULE",
+            "SYS.REFERENTIAL_CONSTRAINTS WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table",
+            "CONSTRAINT_NAME, POSITION",
+            table_name,
+            schema,
+        )
+        return self._reflect_foreign_keys(rows)
+
+    @override
+    @snapshot_multi
+    def get_multi_foreign_keys(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None = None,
+        filter_names: Collection[str] | None = None,
+        scope: reflection.ObjectScope = reflection.ObjectScope.DEFAULT,
+        kind: reflection.ObjectKind = reflection.ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[tuple[TableKey, list[ReflectedForeignKeyConstraint]]]:
+        data = self._get_multi_rows(
+            connection,
+            "SELECT TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME, REFERENCED_SCHEMA_NAME, "
+            "REFERENCED_TABLE_NAME, REFERENCED_COLUMN_NAME, UPDATE_RULE, DELETE_RULE "
+            "FROM SYS.REFERENTIAL_CONSTRAINTS "
+            "WHERE SCHEMA_NAME=:schema {filter_names} "
+            "ORDER BY TABLE_NAME, CONSTRAINT_NAME, POSITION",
+            schema,
+            scope,
+            kind,
+            filter_names,
+            **kw,
+        )
+        return [(key, self._reflect_foreign_keys(rows)) for key, rows in data]
+
+    @override
+    @reflection.cache
+    def get_indexes(
+        self,
+        connection: Connection,
+        table_name: str,
+        schema: str | None = None,
+        **kw: Any,
+    ) -> list[ReflectedIndex]:
+        columns, source = self._index_columns_source()
+        rows = self._get_table_rows(
+            connection,
+            columns,
+            f"{source} WHERE INDEX_COLUMNS.SCHEMA_NAME=:schema "
+            "AND INDEX_COLUMNS.TABLE_NAME=:table",
+            "INDEX_COLUMNS.POSITION",
+            table_name,
+            schema,
+        )
+        return self._reflect_indexes(rows)
+
+    @override
+    @snapshot_multi
+    def get_multi_indexes(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None = None,
+        filter_names: Collection[str] | None = None,
+        scope: reflection.ObjectScope = reflection.ObjectScope.DEFAULT,
+        kind: reflection.ObjectKind = reflection.ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[tuple[TableKey, list[ReflectedIndex]]]:
+        data = self._get_multi_rows(
+            connection,
+            self._index_columns_query(
+                "INDEX_COLUMNS.SCHEMA_NAME=:schema {filter_names}",
+                "INDEX_COLUMNS.TABLE_NAME, INDEX_COLUMNS.POSITION",
+                with_table_name=True,
+            ),
+            schema,
+            scope,
+            kind,
+            filter_names,
+            name_column="INDEX_COLUMNS.TABLE_NAME",
+            **kw,
+        )
+        return [(key, self._reflect_indexes(rows)) for key, rows in data]
+
+    @override
+    @reflection.cache
+    def get_pk_constraint(
+        self,
+        connection: Connection,
+        table_name: str,
+        schema: str | None = None,
+        **kw: Any,
+    ) -> ReflectedPrimaryKeyConstraint:
+        rows = self._get_table_rows(
+            connection,
+            "CONSTRAINT_NAME, COLUMN_NAME",
+            "SYS.CONSTRAINTS WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table AND "
+            "IS_PRIMARY_KEY='TRUE'",
+            "POSITION",
+            table_name,
+            schema,
+        )
+        return self._reflect_pk_constraint(rows)
+
+    @override
+    @snapshot_multi
+    def get_multi_pk_constraint(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None = None,
+        filter_names: Collection[str] | None = None,
+        scope: reflection.ObjectScope = reflection.ObjectScope.DEFAULT,
+        kind: reflection.ObjectKind = reflection.ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[tuple[TableKey, ReflectedPrimaryKeyConstraint]]:
+        data = self._get_multi_rows(
+            connection,
+            "SELECT TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME FROM SYS.CONSTRAINTS "
+            "WHERE SCHEMA_NAME=:schema AND IS_PRIMARY_KEY='TRUE' {filter_names} "
+            "ORDER BY TABLE_NAME, POSITION",
+            schema,
+            scope,
+            kind,
+            filter_names,
+            **kw,
+        )
+        return [(key, self._reflect_pk_constraint(rows)) for key, rows in data]
+
+    @override
+    @reflection.cache
+    def get_unique_constraints(
+        self,
+        connection: Connection,
+        table_name: str,
+        schema: str | None = None,
+        **kw: Any,
+    ) -> list[ReflectedUniqueConstraint]:
+        rows = self._get_table_rows(
+            connection,
+            "CONSTRAINT_NAME, COLUMN_NAME",
+            "SYS.CONSTRAINTS WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table AND "
+            "IS_UNIQUE_KEY='TRUE' AND IS_PRIMARY_KEY='FALSE'",
+            "CONSTRAINT_NAME, POSITION",
+            table_name,
+            schema,
+        )
+        return self._reflect_unique_constraints(rows)
+
+    @override
+    @snapshot_multi
+    def get_multi_unique_constraints(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None = None,
+        filter_names: Collection[str] | None = None,
+        scope: reflection.ObjectScope = reflection.ObjectScope.DEFAULT,
+        kind: reflection.ObjectKind = reflection.ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[tuple[TableKey, list[ReflectedUniqueConstraint]]]:
+        data = self._get_multi_rows(
+            connection,
+            "SELECT TABLE_NAME, CONSTRAINT_NAME, COLUMN_NAME FROM SYS.CONSTRAINTS "
+            "WHERE SCHEMA_NAME=:schema AND "
+            "IS_UNIQUE_KEY='TRUE' AND IS_PRIMARY_KEY='FALSE' {filter_names} "
+            "ORDER BY TABLE_NAME, CONSTRAINT_NAME, POSITION",
+            schema,
+            scope,
+            kind,
+            filter_names,
+            **kw,
+        )
+        return [(key, self._reflect_unique_constraints(rows)) for key, rows in data]
+
+    @override
+    @reflection.cache
+    def get_check_constraints(
+        self,
+        connection: Connection,
+        table_name: str,
+        schema: str | None = None,
+        **kw: Any,
+    ) -> list[ReflectedCheckConstraint]:
+        rows = self._get_table_rows(
+            connection,
+            "CONSTRAINT_NAME, CHECK_CONDITION",
+            "SYS.CONSTRAINTS WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table AND "
+            "CHECK_CONDITION IS NOT NULL",
+            "CONSTRAINT_NAME",
+            table_name,
+            schema,
+        )
+        return self._reflect_check_constraints(rows)
+
+    @override
+    @snapshot_multi
+    def get_multi_check_constraints(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None = None,
+        filter_names: Collection[str] | None = None,
+        scope: reflection.ObjectScope = reflection.ObjectScope.DEFAULT,
+        kind: reflection.ObjectKind = reflection.ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[tuple[TableKey, list[ReflectedCheckConstraint]]]:
+        data = self._get_multi_rows(
+            connection,
+            "SELECT TABLE_NAME, CONSTRAINT_NAME, CHECK_CONDITION FROM SYS.CONSTRAINTS "
+            "WHERE SCHEMA_NAME=:schema AND CHECK_CONDITION IS NOT NULL {filter_names}",
+            schema,
+            scope,
+            kind,
+            filter_names,
+            **kw,
+        )
+        return [(key, self._reflect_check_constraints(rows)) for key, rows in data]
+
     @reflection.cache
     def get_table_oid(
         self,
@@ -1333,20 +2264,154 @@ class HANAHDBCLIDialect(default.DefaultDialect):
         schema: str | None = None,
         **kw: Any,
     ) -> ReflectedTableComment:
-        schema_name = schema or self.default_schema_name
-        if not self.has_table(connection, table_name, schema_name, **kw):
-            raise exc.NoSuchTableError()
+        rows = self._get_table_rows(
+            connection,
+            "COMMENTS",
+            "SYS.TABLES WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table",
+            "TABLE_NAME",
+            table_name,
+            schema,
+        )
+        return self._reflect_table_comment(rows)
 
-        result = connection.execute(
-            sql.text(
-                "SELECT COMMENTS FROM SYS.TABLES WHERE SCHEMA_NAME=:schema AND TABLE_NAME=:table"
-            ).bindparams(
-                schema=self.denormalize_name(schema_name),
-                table=self.denormalize_name(table_name),
+    @override
+    @snapshot_multi
+    def get_multi_table_comment(
+        self,
+        connection: Connection,
+        *,
+        schema: str | None = None,
+        filter_names: Collection[str] | None = None,
+        scope: reflection.ObjectScope = reflection.ObjectScope.DEFAULT,
+        kind: reflection.ObjectKind = reflection.ObjectKind.TABLE,
+        **kw: Any,
+    ) -> Iterable[tuple[TableKey, ReflectedTableComment]]:
+        data = self._get_multi_rows(
+            connection,
+            "SELECT TABLE_NAME, COMMENTS FROM SYS.TABLES "
+            "WHERE SCHEMA_NAME=:schema {filter_names}",
+            schema,
+            scope,
+            kind,
+            filter_names,
+            **kw,
+        )
+        return [(key, self._reflect_table_comment(rows)) for key, rows in data]
+
+    def get_next_primary_key_values(
+        self, connection: Connection, column: Column[Any], count: int
+    ) -> list[int]:
+        """Allocate ``count`` primary key values for the given column using one statement.
+
+        The values are taken from the sequence of the column or, for identity columns,
+        from the sequence maintained by SAP HANA for the identity.
+        """
+        if not isinstance(column.default, Sequence):
+            sequence = self._get_identity_sequence(connection, column.table)
+            return self._fetch_sequence_values(connection, sequence, count)
+
+        sequence = self.identifier_preparer.format_sequence(column.default)
+        if self.sequence_cache is None:
+            return self._fetch_sequence_values(connection, sequence, count)
+        return self.sequence_cache.get(
+            sequence,
+            count,
+            lambda size: self._fetch_sequence_values(connection, sequence, size),
+        )
+
+    def _fetch_sequence_values(
+        self, connection: Connection, sequence: str, count: int
+    ) -> list[int]:
+        result = connection.exec_driver_sql(sequence_values_query(sequence), (count,))
+        return sorted(row[0] for row in result)
+
+    def _get_identity_sequence(self, connection: Connection, table: Table) -> str:
+        return self._format_identity_sequence(
+            table.schema,
+            table.name,
+            lambda params: connection.exec_driver_sql(
+                _IDENTITY_SEQUENCE_QUERY, params
+            ).scalar(),
+        )
+
+    def _format_identity_sequence(
+        self,
+        schema: str | None,
+        table_name: str,
+        fetch: Callable[[tuple[str, str]], str | None],
+    ) -> str:
+        """Return the formatted name of the sequence maintained for an identity column.
+
+        ``fetch`` executes ``_IDENTITY_SEQUENCE_QUERY`` with the given parameters.
+        """
+        schema_name = self.denormalize_name(schema or self.default_schema_name)
+        sequence_name = fetch((schema_name, self.denormalize_name(table_name)))
+        if sequence_name is None:
+            raise exc.InvalidRequestError(
+                f"No identity sequence found for table '{table_name}'"
             )
+
+        quote = self.identifier_preparer.quote_identifier
+        return f"{quote(schema_name)}.{quote(sequence_name)}"
+
+    @override
+    def do_execute(
+        self,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None = None,
+    ) -> None:
+        if _is_prepared(cursor, statement):
+            cursor.executeprepared(parameters)
+        else:
+            cursor.execute(statement, parameters)
+
+    @override
+    def do_executemany(
+        self,
+        cursor: DBAPICursor,
+        statement: str,
+        parameters: Any,
+        context: ExecutionContext | None = None,
+    ) -> None:
+        batch_size = (
+            context.execution_options.get("hana_executemany_batch_size")
+            if context is not None
+            else None
         )
+        if not batch_size:
+            self._executemany(cursor, statement, parameters)
+            return
 
-        return {"text": result.scalar()}
+        assert isinstance(context, HANAExecutionContext)
+        batches = range(0, len(parameters), batch_size)
+        rowcount = 0
+        for number, start in enumerate(batches, 1):
+            batch = parameters[start : start + batch_size]
+            started = time.perf_counter()
+            self._executemany(cursor, statement, batch)
+            logger.debug(
+                "executemany batch %d of %d: %d rows in %.5fs",
+                number,
+                len(batches),
+                len(batch),
+                time.perf_counter() - started,
+            )
+            # the rowcount of the cursor only covers the last call
+            if rowcount >= 0 and cursor.rowcount >= 0:
+                rowcount += cursor.rowcount
+            else:
+                rowcount = -1
+        context._rowcount = rowcount
+
+    def _executemany(
+        self, cursor: DBAPICursor, statement: str, parameters: Any
+    ) -> None:
+        if _is_prepared(cursor, statement):
+            cursor.executemanyprepared(parameters)
+        else:
+            cursor.executemany(statement, parameters)
 
     @override
     def do_rollback_to_savepoint(self, connection: Connection, name: str) -> None:
@@ -1362,19 +2427,101 @@ class HANAHDBCLIDialect(default.DefaultDialect):
         super().do_rollback_to_savepoint(connection, name)
 
 
+def _is_prepared(cursor: DBAPICursor, statement: str) -> bool:
+    return isinstance(cursor, PreparedCursor) and cursor.prepared_statement == statement
+
+
+async def _run_blocking(fn: Callable[..., Any], *args: Any) -> Any:
+    """Run a blocking hdbcli call in the default executor of the event loop.
+
+    hdbcli runs its own coroutines the same way, but not all calls which may send a request to
+    the server are coroutines.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, functools.partial(fn, *args))
+
+
 class AsyncCursor(AsyncAdapt_dbapi_cursor):
     """Async adapted cursor for SAP HANA."""
 
+    def setfetchsize(self, value: int) -> None:
+        """Set the number of rows prefetched from the server."""
+        self._cursor.setfetchsize(value)  # type: ignore[attr-defined]
+
+    @override
+    def setinputsizes(self, *inputsizes: Any) -> None:
+        # a synchronous method of the hdbcli cursor, which only stores the sizes locally
+        self._cursor.setinputsizes(*inputsizes)  # type: ignore[unused-coroutine]
+
+    def callproc(self, procname: str, parameters: Any = ()) -> Any:
+        """Call a stored procedure."""
+        return util.await_only(self._callproc_async(procname, parameters))
+
+    async def _callproc_async(self, procname: str, parameters: Any) -> Any:
+        async with self._adapt_connection._execute_mutex:
+            result = await self._cursor.callproc(procname, parameters)
+            if self._cursor.description:
+                self._rows = collections.deque(await self._cursor.fetchall())
+            return result
+
+
+class AsyncServerSideCursor(AsyncAdapt_dbapi_ss_cursor, AsyncCursor):
+    """Async adapted server side cursor for SAP HANA.
+
+    Rows are only fetched when they are consumed, in batches of ``arraysize`` rows; together
+    with the fetch size of hdbcli this bounds the number of rows buffered by the client.
+    """
+
+    __slots__ = ()
+
+    @override
+    def fetchmany(self, size: int | None = None) -> Any:
+        if size is None:
+            size = self.arraysize
+        return util.await_only(self._cursor.fetchmany(size))
+
+    @override
+    def __iter__(self) -> Iterator[Any]:
+        # hdbcli cursors do not support async iteration
+        while rows := self.fetchmany():
+            yield from rows
+
 
 class AsyncConnection(AsyncAdapt_dbapi_connection):
-    """Async adapted connection for SAP HANA."""
+    """Async adapted connection for SAP HANA.
+
+    Only calls which are answered locally by hdbcli, like ``isconnected`` and
+    ``getautocommit``, are delegated to the underlying connection; calls which may send a
+    request to the server are awaited.
+    """
 
     _cursor_cls = AsyncCursor
+    _ss_cursor_cls = AsyncServerSideCursor
 
     def __getattr__(self, name: str) -> Any:
         """Delegate attribute access to the underlying synchronous connection."""
         return getattr(self._connection, name)
 
+    def setautocommit(self, value: bool) -> None:
+        """Set the autocommit mode; enabling it commits the open transaction."""
+        self._await_blocking(self._connection.setautocommit, value)
+
+    def ping(self) -> bool:
+        """Check the connection with a round trip to the server."""
+        return bool(self._await_blocking(self._connection.ping))
+
+    def cancel(self) -> bool:
+        """Cancel the statement currently executed on the connection."""
+        # not serialized with the execute mutex, the statement to cancel holds it
+        return bool(util.await_only(self._connection.cancel()))
+
+    def _await_blocking(self, fn: Callable[..., Any], *args: Any) -> Any:
+        async def run() -> Any:
+            async with self._execute_mutex:
+                return await _run_blocking(fn, *args)
+
+        return util.await_only(run())
+
 
 class async_dbapi:
     """Async adapted dbapi wrapper for SAP HANA."""
@@ -1397,6 +2544,13 @@ class AsyncHANAHDBCLIDialect(HANAHDBCLIDialect):
     is_async = True
     supports_statement_cache = True
 
+    def __init__(self, **kw: Any) -> None:
+        if kw.get("prepared_statement_cache_size") is not None:
+            raise exc.ArgumentError(
+                "prepared_statement_cache_size is not supported by the async dialect"
+            )
+        super().__init__(**kw)
+
     @classmethod
     @override
     def import_dbapi(cls) -> ModuleType:
@@ -1414,5 +2568,6 @@ class AsyncHANAHDBCLIDialect(HANAHDBCLIDialect):
             self,
             util.await_only(self.loaded_dbapi.connect(*args, **kw)),
         )
-        conn._connection.setautocommit(False)
+        self._forget_connection(conn)  # type: ignore[arg-type]
+        conn.setautocommit(False)
         return conn  # type: ignore[return-value]
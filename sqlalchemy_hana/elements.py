@@ -2,16 +2,31 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any, Literal
 
+from sqlalchemy import select
 from sqlalchemy import table as table_clause
+from sqlalchemy.exc import ArgumentError
+from sqlalchemy.sql import coercions, roles
+from sqlalchemy.sql.base import (  # pylint: disable=import-private-name
+    Executable,
+    _generative,
+)
 from sqlalchemy.sql.ddl import DDLElement
-from sqlalchemy.sql.dml import DMLWhereBase, Insert
+from sqlalchemy.sql.dml import DMLWhereBase, Insert, UpdateBase
+from sqlalchemy.sql.elements import ClauseElement, ColumnElement
 from sqlalchemy.sql.selectable import Select, TableClause
+from sqlalchemy.sql.visitors import InternalTraversal
 from typing_extensions import override
 
+from sqlalchemy_hana.functions import cosine_similarity, l2distance, to_real_vector
+
 if TYPE_CHECKING:
+    from typing_extensions import Self
+
     AnySelect = Select[Any]
+    AnyColumnElement = ColumnElement[Any]
 
 
 class CreateView(DDLElement):
@@ -57,8 +72,23 @@ class Upsert(Insert, DMLWhereBase):  # type: ignore[misc]
     """Upsert element for SAP HANA."""
 
     __visit_name__ = "upsert"
-    # until https://github.com/sqlalchemy/sqlalchemy/issues/8321 is implemented we don't cache
-    inherit_cache = False
+    inherit_cache = True
+
+    _with_primary_key = False
+
+    _traverse_internals = Insert._traverse_internals + [
+        ("_where_criteria", InternalTraversal.dp_clauseelement_tuple),
+        ("_with_primary_key", InternalTraversal.dp_boolean),
+    ]
+
+    @_generative
+    def with_primary_key(self) -> Self:
+        """Render ``WITH PRIMARY KEY`` to match existing rows by their primary key.
+
+        This can not be combined with a WHERE clause.
+        """
+        self._with_primary_key = True
+        return self
 
     @property
     @override
@@ -67,9 +97,184 @@ class Upsert(Insert, DMLWhereBase):  # type: ignore[misc]
         return "insert"
 
 
-def upsert(table: Any) -> Upsert:
-    """Helper function to create an upsert clause element."""
-    return Upsert(table)
+def upsert(table: Any, *, batch_size: int | None = None) -> Upsert:
+    """Helper function to create an upsert clause element.
+
+    If ``batch_size`` is given, executions with multiple parameter sets are split into
+    ``executemany`` calls of at most ``batch_size`` rows.
+    The rowcount of the result is the sum of the rowcounts of all batches.
+    """
+    statement = Upsert(table)
+    if batch_size is not None:
+        if batch_size < 1:
+            raise ArgumentError("batch_size must be greater than 0")
+        statement = statement.execution_options(hana_executemany_batch_size=batch_size)
+    return statement
+
+
+class _MergeWhen(ClauseElement):
+    """A WHEN clause of a MERGE INTO statement."""
+
+    __visit_name__ = "merge_when"
+
+    _traverse_internals = [
+        ("matched", InternalTraversal.dp_boolean),
+        ("action", InternalTraversal.dp_string),
+        ("condition", InternalTraversal.dp_clauseelement),
+        ("columns", InternalTraversal.dp_clauseelement_tuple),
+        ("values", InternalTraversal.dp_clauseelement_tuple),
+    ]
+
+    def __init__(
+        self,
+        matched: bool,
+        action: str,
+        condition: AnyColumnElement | None,
+        columns: tuple[AnyColumnElement, ...] = (),
+        values: tuple[AnyColumnElement, ...] = (),
+    ):
+        self.matched = matched
+        self.action = action
+        self.condition = condition
+        self.columns = columns
+        self.values = values
+
+
+class MergeInto(UpdateBase):
+    """MERGE INTO element for SAP HANA."""
+
+    __visit_name__ = "merge_into"
+    inherit_cache = True
+
+    _when_clauses: tuple[_MergeWhen, ...] = ()
+
+    _traverse_internals = [
+        ("table", InternalTraversal.dp_clauseelement),
+        ("source", InternalTraversal.dp_clauseelement),
+        ("onclause", InternalTraversal.dp_clauseelement),
+        ("_when_clauses", InternalTraversal.dp_clauseelement_tuple),
+        ("_hints", InternalTraversal.dp_table_hint_list),
+    ] + Executable._executable_traverse_internals
+
+    def __init__(self, table: Any, source: Any, onclause: Any):
+        self.table = coercions.expect(roles.DMLTableRole, table)
+        self.source = coercions.expect(roles.FromClauseRole, source)
+        self.onclause = coercions.expect(roles.OnClauseRole, onclause)
+
+    def _condition(self, condition: Any) -> AnyColumnElement | None:
+        if condition is None:
+            return None
+        return coercions.expect(roles.WhereHavingRole, condition)
+
+    def _values(
+        self, values: Mapping[Any, Any]
+    ) -> tuple[tuple[AnyColumnElement, ...], tuple[AnyColumnElement, ...]]:
+        if not values:
+            raise ArgumentError("At least one value is required")
+
+        columns = []
+        expressions = []
+        for key, value in values.items():
+            column = self.table.c[key] if isinstance(key, str) else key
+            if self.table.c.corresponding_column(column) is None:
+                raise ArgumentError(
+                    f"Column {column} is not part of the target table {self.table}"
+                )
+            columns.append(column)
+            expressions.append(
+                coercions.expect(roles.ExpressionElementRole, value, type_=column.type)
+            )
+        return tuple(columns), tuple(expressions)
+
+    @_generative
+    def when_matched_then_update(
+        self, values: Mapping[Any, Any], condition: Any = None
+    ) -> Self:
+        """Update matched target rows with the given values.
+
+        ``values`` maps target columns or their names to the new values.
+        """
+        columns, expressions = self._values(values)
+        self._when_clauses += (
+            _MergeWhen(
+                True, "UPDATE", self._condition(condition), columns, expressions
+            ),
+        )
+        return self
+
+    @_generative
+    def when_matched_then_delete(self, condition: Any = None) -> Self:
+        """Delete matched target rows."""
+        self._when_clauses += (_MergeWhen(True, "DELETE", self._condition(condition)),)
+        return self
+
+    @_generative
+    def when_not_matched_then_insert(
+        self, values: Mapping[Any, Any], condition: Any = None
+    ) -> Self:
+        """Insert the given values for source rows without a matching target row.
+
+        ``values`` maps target columns or their names to the inserted values.
+        """
+        columns, expressions = self._values(values)
+        self._when_clauses += (
+            _MergeWhen(
+                False, "INSERT", self._condition(condition), columns, expressions
+            ),
+        )
+        return self
+
+
+def merge_into(table: Any, source: Any, onclause: Any) -> MergeInto:
+    """Helper function to create a merge into clause element.
+
+    ``source`` can be a table, a subquery or a CTE, which is rendered as a subquery.
+    """
+    return MergeInto(table, source, onclause)
+
+
+def top_k_similar(
+    column: ColumnElement[Any],
+    query_vector: Any,
+    k: int,
+    metric: Literal["COSINE_SIMILARITY", "L2DISTANCE"] = "COSINE_SIMILARITY",
+) -> AnySelect:
+    """Select the ``k`` rows of a table whose vectors are the most similar to a query vector.
+
+    The statement is ordered by the similarity function and limited to ``k`` rows, which allows
+    SAP HANA to use a vector index on the column with the same similarity function.
+    ``query_vector`` can be a sequence of floats, a vector string like ``"[1, 2, 3]"`` or a
+    SQL expression.
+    """
+    table = getattr(column, "table", None)
+    if table is None:
+        raise ArgumentError(f"Column {column} is not part of a table")
+    if k < 1:
+        raise ArgumentError("k must be greater than 0")
+
+    if not isinstance(query_vector, ClauseElement):
+        if not isinstance(query_vector, str):
+            query_vector = f"[{', '.join(str(float(value)) for value in query_vector)}]"
+        query_vector = to_real_vector(query_vector)
+
+    metric_name = metric.upper()
+    if metric_name == "COSINE_SIMILARITY":
+        order_by = cosine_similarity(column, query_vector).desc()
+    elif metric_name == "L2DISTANCE":
+        order_by = l2distance(column, query_vector).asc()
+    else:
+        raise ArgumentError(f"Unsupported similarity metric '{metric}'")
+
+    return select(table).order_by(order_by).limit(k)
 
 
-__all__ = ("CreateView", "DropView", "Upsert", "upsert", "view")
+__all__ = (
+    "CreateView",
+    "DropView",
+    "MergeInto",
+    "Upsert",
+    "merge_into",
+    "top_k_similar",
+    "upsert",
+    "view",
+)
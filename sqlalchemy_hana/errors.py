@@ -7,10 +7,13 @@ exception if possible.
 
 from __future__ import annotations
 
+import re
+import threading
+from collections.abc import Iterable, Sequence
 from typing import TYPE_CHECKING, cast
 
 from hdbcli.dbapi import Error as HdbcliError
-from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import ArgumentError, DBAPIError
 
 if TYPE_CHECKING:
     from typing_extensions import Self
@@ -104,6 +107,189 @@ class DistributedTransactionCommitFailureError(StatementExecutionError):
     """Exception raised when a distributed transaction commit fails."""
 
 
+class ErrorRule:
+    """Rule mapping hdbcli errors to an exception class of this module.
+
+    A rule matches an error if its code is one of ``codes`` and its text contains one of
+    ``texts`` or matches the regular expression ``pattern``.
+    If ``codes`` is ``None``, errors with any code are matched; if neither ``texts`` nor
+    ``pattern`` is given, errors with any text are matched.
+    """
+
+    def __init__(
+        self,
+        error_class: type[HANAError],
+        codes: Iterable[int] | None = None,
+        texts: Iterable[str] = (),
+        pattern: str | re.Pattern[str] | None = None,
+    ) -> None:
+        self.error_class = error_class
+        self.codes = frozenset(codes) if codes is not None else None
+        self.texts = tuple(texts)
+        self.pattern = re.compile(pattern) if pattern is not None else None
+        if self.codes is None and not self.texts and self.pattern is None:
+            raise ArgumentError("Either codes, texts or pattern must be given")
+
+    @property
+    def any_text(self) -> bool:
+        """Whether the rule matches errors with any text."""
+        return not self.texts and self.pattern is None
+
+
+# evaluated in order, the first matching rule wins
+_BUILTIN_RULES = (
+    ErrorRule(
+        ClientConnectionError,
+        codes=[
+            -10807,  # SQLDBC_ERR_CONNECTION_DOWN
+            -10709,  # SQLDBC_ERR_CONNECTFAILED_INTERNAL
+            -10735,  # SQLDBC_ERR_WRONG_REPLICATION_ROLE
+        ],
+    ),
+    ErrorRule(StatementTimeoutError, codes=[613]),
+    ErrorRule(
+        TransactionCancelledError,
+        codes=[139],
+        texts=["current operation cancelled by request and transaction rolled back"],
+    ),
+    ErrorRule(
+        SequenceCacheTimeoutError,
+        texts=["Lock timeout occurs while waiting sequence cache lock"],
+    ),
+    ErrorRule(
+        SequenceLockTimeoutError,
+        codes=[131],
+        texts=["Lock timeout occurs while waiting sequence lock"],
+    ),
+    ErrorRule(LockWaitTimeoutError, codes=[131]),
+    ErrorRule(LockAcquisitionError, codes=[146]),
+    ErrorRule(DeadlockError, codes=[133]),
+    ErrorRule(
+        DatabaseOutOfMemoryError,
+        texts=[
+            "OutOfMemory exception",
+            "cannot allocate enough memory",
+            "Allocation failed",
+        ],
+    ),
+    ErrorRule(DatabaseOutOfMemoryError, codes=[4]),
+    ErrorRule(
+        DatabaseOverloadedError,
+        codes=[129],
+        texts=["max number of SqlExecutor threads are exceeded"],
+    ),
+    ErrorRule(
+        DatabaseConnectNotPossibleError,
+        # ERR_SQL_CONNECT_NOT_ALLOWED: user not allowed to connect from client
+        codes=[663],
+        # GBA503: geo blocking service responded with a 503
+        texts=["Error GBA503: Service is unavailable"],
+    ),
+    ErrorRule(
+        DatabaseConnectNotPossibleError,
+        pattern=r"\A(?:HANA Cloud region is in maintenance window"
+        r"|HANA Database instance (?:upgrade|resize) in progress)\Z",
+    ),
+    # ERR_URS_INSTANCE_NOT_AVAILABLE: HANA Database service is not available
+    ErrorRule(DatabaseConnectNotPossibleError, codes=[1888]),
+    # HANA is current starting
+    ErrorRule(
+        DatabaseConnectNotPossibleError,
+        texts=["TransactionManager is not yet fully initialized"],
+    ),
+    # 129 -> ERR_TX_ROLLBACK: transaction rolled back by an internal error
+    ErrorRule(StatementExecutionError, codes=[129, 145]),
+    ErrorRule(
+        StatementExecutionError,
+        texts=[
+            "An error occurred while opening the channel",
+            "Exception in executor plan",
+            "DTX commit(first phase commit) failed",
+            "An error occurred while reading from the channel",
+            "temp index not exists",
+        ],
+    ),
+    ErrorRule(InvalidObjectNameError, codes=[397]),
+    ErrorRule(
+        WriteInReadOnlyReplicationError,
+        pattern=r"\Afeature not supported: "
+        r"writable statement not allowed in read-enabled replication",
+    ),
+    ErrorRule(SessionContextError, codes=[597]),
+    ErrorRule(
+        NumberOfTransactionsExceededError,
+        texts=["exceed maximum number of transactions"],
+    ),
+    # 149 -> ERR_TX_DIST_2PC_FAILURE
+    ErrorRule(DistributedTransactionCommitFailureError, codes=[149]),
+)
+
+_Dispatch = tuple[tuple[type[HANAError], tuple[str, ...], re.Pattern[str] | None], ...]
+
+
+class _RuleTable:
+    """Rules to be checked per error code.
+
+    Only the rules which can match an error code are kept for it, and rules after the first
+    rule matching any text are dropped; most codes do not need a text comparison at all.
+    """
+
+    def __init__(self, rules: Sequence[ErrorRule]) -> None:
+        self.default = self._dispatch(rules, None)
+        self.by_code = {
+            code: self._dispatch(rules, code)
+            for rule in rules
+            if rule.codes is not None
+            for code in rule.codes
+        }
+
+    @staticmethod
+    def _dispatch(rules: Sequence[ErrorRule], code: int | None) -> _Dispatch:
+        dispatch = []
+        for rule in rules:
+            if rule.codes is None or code in rule.codes:
+                dispatch.append((rule.error_class, rule.texts, rule.pattern))
+                if rule.any_text:
+                    break
+        return tuple(dispatch)
+
+
+_custom_rules: list[ErrorRule] = []
+_rule_table = _RuleTable(_BUILTIN_RULES)
+_registry_lock = threading.Lock()
+
+
+def register_error_rule(
+    error_class: type[HANAError],
+    codes: Iterable[int] | None = None,
+    texts: Iterable[str] = (),
+    pattern: str | re.Pattern[str] | None = None,
+) -> ErrorRule:
+    """Register an additional rule for :py:func:`convert_dbapi_error`.
+
+    Registered rules are checked before the built-in rules, in the order of their registration.
+    See :py:class:`ErrorRule` for the parameters.
+    The created rule is returned, it can be removed using :py:func:`unregister_error_rule`.
+    """
+    rule = ErrorRule(error_class, codes, texts, pattern)
+    with _registry_lock:
+        _custom_rules.append(rule)
+        _rebuild_rule_table()
+    return rule
+
+
+def unregister_error_rule(rule: ErrorRule) -> None:
+    """Remove a rule registered using :py:func:`register_error_rule`."""
+    with _registry_lock:
+        _custom_rules.remove(rule)
+        _rebuild_rule_table()
+
+
+def _rebuild_rule_table() -> None:
+    global _rule_table  # pylint: disable=global-statement
+    _rule_table = _RuleTable([*_custom_rules, *_BUILTIN_RULES])
+
+
 def convert_dbapi_error(dbapi_error: DBAPIError) -> DBAPIError:
     """Takes a :py:exc:`sqlalchemy.exc.DBAPIError` and returns a more specific error if possible.
 
@@ -111,92 +297,25 @@ def convert_dbapi_error(dbapi_error: DBAPIError) -> DBAPIError:
     :py:exc:`hdbcli.dbapi.Error`.
     If it does not contain a hdbcli error, the original exception is returned.
 
-    Else the error code and error text are further checked.
+    Else the error code and error text are checked against the built-in rules and the rules
+    registered using :py:func:`register_error_rule`.
     """
     error = dbapi_error.orig
     if not isinstance(error, HdbcliError):
         return dbapi_error
 
-    if error.errorcode in [
-        -10807,  # SQLDBC_ERR_CONNECTION_DOWN
-        -10709,  # SQLDBC_ERR_CONNECTFAILED_INTERNAL
-        -10735,  # SQLDBC_ERR_WRONG_REPLICATION_ROLE
-    ]:
-        return ClientConnectionError.from_dbapi_error(dbapi_error)
-    if error.errorcode == 613:
-        return StatementTimeoutError.from_dbapi_error(dbapi_error)
-    if (
-        error.errorcode == 139
-        and "current operation cancelled by request and transaction rolled back"
-        in error.errortext
-    ):
-        return TransactionCancelledError.from_dbapi_error(dbapi_error)
-    if "Lock timeout occurs while waiting sequence cache lock" in str(error.errortext):
-        return SequenceCacheTimeoutError.from_dbapi_error(dbapi_error)
-    if (
-        error.errorcode == 131
-        and "Lock timeout occurs while waiting sequence lock" in error.errortext
-    ):
-        return SequenceLockTimeoutError.from_dbapi_error(dbapi_error)
-    if error.errorcode == 131:
-        return LockWaitTimeoutError.from_dbapi_error(dbapi_error)
-    if error.errorcode == 146:
-        return LockAcquisitionError.from_dbapi_error(dbapi_error)
-    if error.errorcode == 133:
-        return DeadlockError.from_dbapi_error(dbapi_error)
-    if (
-        "OutOfMemory exception" in error.errortext
-        or "cannot allocate enough memory" in error.errortext
-        or "Allocation failed" in error.errortext
-        or error.errorcode == 4
+    table = _rule_table
+    errortext = str(error.errortext)
+    for error_class, texts, pattern in table.by_code.get(
+        error.errorcode, table.default
     ):
-        return DatabaseOutOfMemoryError.from_dbapi_error(dbapi_error)
-    if (
-        error.errorcode == 129
-        and "max number of SqlExecutor threads are exceeded" in error.errortext
-    ):
-        return DatabaseOverloadedError.from_dbapi_error(dbapi_error)
-    if (
-        (  # ERR_SQL_CONNECT_NOT_ALLOWED: user not allowed to connect from client
-            error.errorcode == 663
-            # GBA503: geo blocking service responded with a 503
-            and "Error GBA503: Service is unavailable" in error.errortext
-        )
-        or error.errortext
-        in {
-            "HANA Cloud region is in maintenance window",
-            "HANA Database instance upgrade in progress",
-            "HANA Database instance resize in progress",
-        }
-        # ERR_URS_INSTANCE_NOT_AVAILABLE: HANA Database service is not available
-        or error.errorcode == 1888
-        # HANA is current starting
-        or "TransactionManager is not yet fully initialized" in error.errortext
-    ):
-        return DatabaseConnectNotPossibleError.from_dbapi_error(dbapi_error)
-    if (
-        # 129 -> ERR_TX_ROLLBACK: transaction rolled back by an internal error
-        error.errorcode in {129, 145}
-        or "An error occurred while opening the channel" in error.errortext
-        or "Exception in executor plan" in error.errortext
-        or "DTX commit(first phase commit) failed" in error.errortext
-        or "An error occurred while reading from the channel" in error.errortext
-        or "temp index not exists" in error.errortext
-    ):
-        return StatementExecutionError.from_dbapi_error(dbapi_error)
-    if error.errorcode == 397:
-        return InvalidObjectNameError.from_dbapi_error(dbapi_error)
-    if error.errortext.startswith(
-        "feature not supported: writable statement not allowed in read-enabled replication"
-    ):
-        return WriteInReadOnlyReplicationError.from_dbapi_error(dbapi_error)
-    if error.errorcode == 597:
-        return SessionContextError.from_dbapi_error(dbapi_error)
-    if "exceed maximum number of transactions" in error.errortext:
-        return NumberOfTransactionsExceededError.from_dbapi_error(dbapi_error)
-    # 149 -> ERR_TX_DIST_2PC_FAILURE
-    if error.errorcode == 149:
-        return DistributedTransactionCommitFailureError.from_dbapi_error(dbapi_error)
+        if not texts and pattern is None:
+            return error_class.from_dbapi_error(dbapi_error)
+        for text in texts:
+            if text in errortext:
+                return error_class.from_dbapi_error(dbapi_error)
+        if pattern is not None and pattern.search(errortext):
+            return error_class.from_dbapi_error(dbapi_error)
     return dbapi_error
 
 
@@ -206,6 +325,7 @@ __all__ = (
     "DatabaseOutOfMemoryError",
     "DatabaseOverloadedError",
     "DeadlockError",
+    "ErrorRule",
     "HANAConnectionError",
     "HANAError",
     "InvalidObjectNameError",
@@ -218,4 +338,6 @@ __all__ = (
     "StatementExecutionError",
     "WriteInReadOnlyReplicationError",
     "convert_dbapi_error",
+    "register_error_rule",
+    "unregister_error_rule",
 )
@@ -0,0 +1,69 @@
+"""ORM utilities for SAP HANA."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from sqlalchemy import Column, Sequence, event, inspect
+from sqlalchemy.orm import Mapper, Session
+
+if TYPE_CHECKING:
+    from sqlalchemy.orm import sessionmaker
+    from sqlalchemy.orm.unitofwork import UOWTransaction
+
+    from sqlalchemy_hana.dialect import HANAHDBCLIDialect
+
+
+def enable_primary_key_prefetch(
+    target: Session | sessionmaker[Any] | type[Session],
+) -> None:
+    """Allocate the primary keys of pending objects in bulk before each flush.
+
+    SAP HANA does not support ``INSERT ... RETURNING``, therefore the ORM needs to insert
+    objects with generated primary keys one by one to fetch the generated keys.
+    If this feature is enabled for a session, the primary keys of all pending objects are
+    allocated upfront from the underlying sequence or identity with one statement per table,
+    which allows the ORM to insert the objects using ``executemany``.
+    """
+    event.listen(target, "before_flush", _prefetch_primary_keys)
+
+
+def _is_prefetchable(column: Column[Any]) -> bool:
+    if isinstance(column.default, Sequence):
+        return True
+    if column.identity is not None:
+        # values can only be set explicitly for GENERATED BY DEFAULT AS IDENTITY
+        return not column.identity.always
+    # the dialect renders an identity for explicit autoincrement columns
+    return (
+        column.autoincrement is True
+        and column.default is None
+        and column.server_default is None
+    )
+
+
+def _prefetch_primary_keys(
+    session: Session, flush_context: UOWTransaction, instances: Any
+) -> None:
+    pending: dict[Column[Any], tuple[Mapper[Any], list[tuple[Any, str]]]] = {}
+    for instance in sorted(session.new, key=lambda obj: inspect(obj).insert_order):
+        mapper = inspect(instance).mapper
+        for column in mapper.primary_key:
+            if not isinstance(column, Column) or not _is_prefetchable(column):
+                continue
+            key = mapper.get_property_by_column(column).key
+            if getattr(instance, key) is None:
+                pending.setdefault(column, (mapper, []))[1].append((instance, key))
+
+    for column, (mapper, targets) in pending.items():
+        connection = session.connection(bind_arguments={"mapper": mapper})
+        if connection.dialect.name != "hana":
+            continue
+
+        dialect: HANAHDBCLIDialect = connection.dialect  # type: ignore[assignment]
+        values = dialect.get_next_primary_key_values(connection, column, len(targets))
+        for (instance, key), value in zip(targets, values, strict=True):
+            setattr(instance, key, value)
+
+
+__all__ = ("enable_primary_key_prefetch",)
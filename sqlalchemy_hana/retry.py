@@ -0,0 +1,273 @@
+"""Retrying of transient SAP HANA errors.
+
+Errors are classified using :py:func:`sqlalchemy_hana.errors.convert_dbapi_error`, each error
+class can have its own :py:class:`RetryPolicy`.
+The backoff between attempts uses exponential growth with full jitter, so that clients failing
+at the same time do not retry in lockstep.
+"""
+
+from __future__ import annotations
+
+import functools
+import random
+import time
+from collections.abc import Callable, Iterable, Iterator, Mapping
+from types import TracebackType
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.exc import ArgumentError, DBAPIError
+
+from sqlalchemy_hana.errors import (
+    ClientConnectionError,
+    DatabaseOverloadedError,
+    DeadlockError,
+    HANAError,
+    LockWaitTimeoutError,
+    SequenceCacheTimeoutError,
+    TransactionCancelledError,
+    convert_dbapi_error,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Engine, ExceptionContext
+    from sqlalchemy.orm import sessionmaker
+
+_T = TypeVar("_T")
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class RetryPolicy:
+    """Retry policy of an error class.
+
+    An operation is attempted at most ``max_attempts`` times.
+    Before the n-th retry, a random delay between zero and
+    ``min(max_backoff, initial_backoff * multiplier ** (n - 1))`` seconds is waited.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 3,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        multiplier: float = 2.0,
+    ) -> None:
+        if max_attempts < 1:
+            raise ArgumentError("max_attempts must be greater than 0")
+        if initial_backoff < 0 or max_backoff < 0:
+            raise ArgumentError("The backoff must not be negative")
+        if multiplier < 1:
+            raise ArgumentError("multiplier must be at least 1")
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.multiplier = multiplier
+
+    def backoff(self, attempt: int) -> float:
+        """Return the delay after the given failed attempt, starting at 1."""
+        ceiling = min(
+            self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1)
+        )
+        return random.uniform(0, ceiling)
+
+
+DEFAULT_POLICIES: Mapping[type[HANAError], RetryPolicy] = {
+    DeadlockError: RetryPolicy(max_attempts=5, initial_backoff=0.05),
+    LockWaitTimeoutError: RetryPolicy(),
+    SequenceCacheTimeoutError: RetryPolicy(),
+    TransactionCancelledError: RetryPolicy(),
+    DatabaseOverloadedError: RetryPolicy(
+        max_attempts=5, initial_backoff=0.5, max_backoff=10.0
+    ),
+    ClientConnectionError: RetryPolicy(initial_backoff=0.5),
+}
+"""Policies for errors which are usually transient."""
+
+
+class RetryEvent:
+    """Information about a failed attempt passed to the listeners of :py:class:`Retrying`."""
+
+    def __init__(self, attempt: int, error: DBAPIError, delay: float | None) -> None:
+        self.attempt = attempt
+        """The number of the failed attempt, starting at 1."""
+        self.error = error
+        """The error converted by :py:func:`sqlalchemy_hana.errors.convert_dbapi_error`."""
+        self.delay = delay
+        """The delay before the next attempt or ``None`` if the error is raised."""
+
+
+class Attempt:
+    """Context manager of a single attempt, see :py:meth:`Retrying.__iter__`."""
+
+    def __init__(self, owner: Retrying, number: int) -> None:
+        self.number = number
+        self._owner = owner
+        self.error: DBAPIError | None = None
+        self._exc_info: tuple[DBAPIError, TracebackType | None] | None = None
+
+    def __enter__(self) -> Attempt:
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> bool:
+        if not isinstance(exc, DBAPIError):
+            return False
+        error = exc if isinstance(exc, HANAError) else convert_dbapi_error(exc)
+        if self._owner.policy(error) is None:
+            return False
+        self.error = error
+        self._exc_info = (exc, tb)
+        return True
+
+
+class Retrying:
+    """Retry operations failing with transient errors.
+
+    ``policies`` maps error classes of :py:mod:`sqlalchemy_hana.errors` to their
+    :py:class:`RetryPolicy`, the policy of the most specific class is used.
+    Errors without a policy are raised immediately.
+    If ``deadline`` is given, no attempt is started later than ``deadline`` seconds after the
+    first one.
+    ``listeners`` are called with a :py:class:`RetryEvent` for each failed attempt.
+
+    An instance can be used as a decorator, using :py:meth:`call` or by iterating over the
+    attempts::
+
+        for attempt in retrying():
+            with attempt:
+                ...
+
+    The retried operation must be idempotent.
+    """
+
+    def __init__(
+        self,
+        policies: Mapping[type[DBAPIError], RetryPolicy] | None = None,
+        *,
+        deadline: float | None = None,
+        listeners: Iterable[Callable[[RetryEvent], None]] = (),
+        sleep: Callable[[float], None] = time.sleep,
+    ) -> None:
+        self.policies = dict(DEFAULT_POLICIES if policies is None else policies)
+        self.deadline = deadline
+        self.listeners = list(listeners)
+        self._sleep = sleep
+
+    def policy(self, error: BaseException) -> RetryPolicy | None:
+        """Return the retry policy of the given converted error."""
+        for cls in type(error).__mro__:
+            policy = self.policies.get(cls)
+            if policy is not None:
+                return policy
+        return None
+
+    def __iter__(self) -> Iterator[Attempt]:
+        started = time.monotonic()
+        number = 0
+        while True:
+            number += 1
+            attempt = Attempt(self, number)
+            yield attempt
+            if attempt.error is None:
+                return
+
+            policy = self.policy(attempt.error)
+            assert policy is not None and attempt._exc_info is not None
+            delay = policy.backoff(number)
+            give_up = number >= policy.max_attempts or (
+                self.deadline is not None
+                and time.monotonic() - started + delay > self.deadline
+            )
+            for listener in self.listeners:
+                listener(RetryEvent(number, attempt.error, None if give_up else delay))
+
+            if give_up:
+                exc, tb = attempt._exc_info
+                raise exc.with_traceback(tb)
+            self._sleep(delay)
+
+    def call(self, fn: Callable[..., _T], *args: Any, **kwargs: Any) -> _T:
+        """Call ``fn`` with the given arguments until it succeeds or the retries give up."""
+        for attempt in self:
+            with attempt:
+                return fn(*args, **kwargs)
+        raise AssertionError("unreachable")  # pragma: no cover
+
+    def __call__(self, fn: _F) -> _F:
+        """Decorate a function to be retried."""
+
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            return self.call(fn, *args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+
+def retrying(
+    policies: Mapping[type[DBAPIError], RetryPolicy] | None = None,
+    *,
+    deadline: float | None = None,
+    listeners: Iterable[Callable[[RetryEvent], None]] = (),
+) -> Retrying:
+    """Create a :py:class:`Retrying` instance, see there for the parameters.
+
+    By default, :py:data:`DEFAULT_POLICIES` are used.
+    """
+    return Retrying(policies, deadline=deadline, listeners=listeners)
+
+
+def retry_transaction(
+    bind: Engine | sessionmaker[Any],
+    fn: Callable[[Any], _T],
+    retrier: Retrying | None = None,
+) -> _T:
+    """Run ``fn`` in a new transaction and rerun it in a new transaction on transient errors.
+
+    ``bind`` can be an engine, then ``fn`` is called with a connection, or a sessionmaker,
+    then ``fn`` is called with a session.
+    The transaction is committed if ``fn`` returns; ``fn`` must be idempotent because a failed
+    transaction is rolled back and ``fn`` is called again.
+    """
+    if retrier is None:
+        retrier = Retrying()
+
+    for attempt in retrier:
+        with attempt, bind.begin() as unit:
+            return fn(unit)
+    raise AssertionError("unreachable")  # pragma: no cover
+
+
+def enable_error_conversion(engine: Engine) -> None:
+    """Raise the errors of :py:mod:`sqlalchemy_hana.errors` from the given engine.
+
+    A ``handle_error`` listener replaces each :py:exc:`sqlalchemy.exc.DBAPIError` by the
+    result of :py:func:`sqlalchemy_hana.errors.convert_dbapi_error`, which allows to catch
+    e.g. :py:exc:`sqlalchemy_hana.errors.DeadlockError` directly.
+    """
+    event.listen(engine, "handle_error", _convert_error)
+
+
+def _convert_error(context: ExceptionContext) -> BaseException | None:
+    error = context.sqlalchemy_exception
+    if isinstance(error, DBAPIError) and not isinstance(error, HANAError):
+        converted = convert_dbapi_error(error)
+        if converted is not error:
+            converted.connection_invalidated = error.connection_invalidated
+            return converted
+    return None
+
+
+__all__ = (
+    "DEFAULT_POLICIES",
+    "Attempt",
+    "RetryEvent",
+    "RetryPolicy",
+    "Retrying",
+    "enable_error_conversion",
+    "retry_transaction",
+    "retrying",
+)
@@ -0,0 +1,185 @@
+"""Routing of read-only transactions to read-enabled secondaries.
+
+With active/active (read-enabled) system replication, the secondary systems accept read-only
+statements.
+:py:class:`ReplicaRouter` sends read-only transactions to the engines of these secondaries as long
+as their replication lag is acceptable and all other transactions to the primary.
+"""
+
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import TYPE_CHECKING, Any, TypeVar
+
+from sqlalchemy import event, text
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import Session
+from typing_extensions import override
+
+from sqlalchemy_hana.errors import WriteInReadOnlyReplicationError, convert_dbapi_error
+
+if TYPE_CHECKING:
+    from sqlalchemy.engine import Connection, Engine
+    from sqlalchemy.orm import SessionTransaction, sessionmaker
+
+_T = TypeVar("_T")
+
+logger = logging.getLogger(__name__)
+
+# executed on the primary, the lag of the slowest secondary in seconds
+REPLICATION_LAG_QUERY = """SELECT
+    MAX(SECONDS_BETWEEN(REPLAYED_LOG_POSITION_TIME, LAST_LOG_POSITION_TIME))
+FROM SYS.M_SERVICE_REPLICATION"""
+
+
+class ReplicaRouter:
+    # pylint: disable=too-many-instance-attributes
+    """Route transactions to the primary or one of the read-enabled secondaries.
+
+    Read-only transactions are distributed round-robin over the ``replicas``.
+    If ``max_lag`` is given, the replication lag is queried on the primary using ``lag_query``
+    at most every ``lag_check_interval`` seconds, and read-only transactions are sent to the
+    primary while the lag exceeds ``max_lag`` seconds or cannot be determined.
+    """
+
+    def __init__(
+        self,
+        primary: Engine,
+        replicas: Sequence[Engine],
+        max_lag: float | None = None,
+        lag_check_interval: float = 10.0,
+        lag_query: str = REPLICATION_LAG_QUERY,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.primary = primary
+        self.replicas = list(replicas)
+        self.max_lag = max_lag
+        self.lag_check_interval = lag_check_interval
+        self.lag_query = lag_query
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._next_replica = itertools.cycle(self.replicas)
+        self._lag: float | None = None
+        self._lag_checked_at: float | None = None
+        self._lag_refreshing = False
+
+    def replication_lag(self) -> float | None:
+        """Return the cached replication lag in seconds, ``None`` if it is unknown.
+
+        While the lag is queried by one thread, other threads get the previous value instead of
+        waiting for the primary.
+        """
+        with self._lock:
+            now = self._clock()
+            if self._lag_refreshing or (
+                self._lag_checked_at is not None
+                and now - self._lag_checked_at < self.lag_check_interval
+            ):
+                return self._lag
+            self._lag_refreshing = True
+
+        # the primary is queried without holding the lock used to choose replicas
+        try:
+            lag = self._query_lag()
+            with self._lock:
+                self._lag = lag
+                self._lag_checked_at = now
+        finally:
+            with self._lock:
+                self._lag_refreshing = False
+        return lag
+
+    def _query_lag(self) -> float | None:
+        try:
+            with self.primary.connect() as connection:
+                lag = connection.execute(text(self.lag_query)).scalar()
+        except DBAPIError:
+            logger.warning("Unable to query the replication lag", exc_info=True)
+            return None
+        return float(lag) if lag is not None else None
+
+    def get_engine(self, read_only: bool) -> Engine:
+        """Return the engine to be used for a new transaction."""
+        if not read_only or not self.replicas:
+            return self.primary
+        if self.max_lag is not None:
+            lag = self.replication_lag()
+            if lag is None or lag > self.max_lag:
+                return self.primary
+        with self._lock:
+            return next(self._next_replica)
+
+    def run(
+        self,
+        fn: Callable[[Any], _T],
+        read_only: bool = True,
+        session_factory: sessionmaker[RoutingSession] | None = None,
+    ) -> _T:
+        """Run ``fn`` in a new transaction routed by this router.
+
+        ``fn`` is called with a connection or, if ``session_factory`` is given, with a
+        :py:class:`RoutingSession`; the transaction is committed if ``fn`` returns.
+        If a read-only transaction fails with
+        :py:exc:`sqlalchemy_hana.errors.WriteInReadOnlyReplicationError`, it is rolled back and
+        ``fn`` is called again in a transaction on the primary.
+        """
+        if read_only:
+            try:
+                return self._run(fn, True, session_factory)
+            except DBAPIError as error:
+                if not isinstance(
+                    convert_dbapi_error(error), WriteInReadOnlyReplicationError
+                ):
+                    raise
+                logger.info("Rerunning a read-only transaction on the primary")
+        return self._run(fn, False, session_factory)
+
+    def _run(
+        self,
+        fn: Callable[[Any], _T],
+        read_only: bool,
+        session_factory: sessionmaker[RoutingSession] | None,
+    ) -> _T:
+        if session_factory is None:
+            with self.get_engine(read_only).begin() as connection:
+                return fn(connection)
+        with session_factory(router=self, read_only=read_only) as session:
+            with session.begin():
+                return fn(session)
+
+
+class RoutingSession(Session):
+    """Session sending its statements to the engine chosen by a :py:class:`ReplicaRouter`.
+
+    The engine is chosen when a transaction starts and kept until it ends.
+    A read-only session uses a replica, statements modifying data fail there with
+    :py:exc:`sqlalchemy_hana.errors.WriteInReadOnlyReplicationError`; see
+    :py:meth:`ReplicaRouter.run` to rerun them on the primary.
+    """
+
+    def __init__(
+        self, router: ReplicaRouter, read_only: bool = False, **kw: Any
+    ) -> None:
+        super().__init__(**kw)
+        self.router = router
+        self.read_only = read_only
+        self._routed_engine: Engine | None = None
+
+    @override
+    def get_bind(self, *args: Any, **kw: Any) -> Engine | Connection:
+        if self._routed_engine is None:
+            self._routed_engine = self.router.get_engine(self.read_only)
+        return self._routed_engine
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _reset_routed_engine(session: Session, transaction: SessionTransaction) -> None:
+    if transaction.parent is None and isinstance(session, RoutingSession):
+        session._routed_engine = None  # pylint: disable=protected-access
+
+
+__all__ = ("REPLICATION_LAG_QUERY", "ReplicaRouter", "RoutingSession")
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 from collections.abc import Callable
 from datetime import date, datetime, time
-from typing import TYPE_CHECKING, Generic, Literal, TypeVar
+from typing import TYPE_CHECKING, Any, Generic, Literal, TypeVar
 
 from sqlalchemy import types as sqltypes
 from sqlalchemy.engine import Dialect
@@ -13,13 +13,20 @@ from typing_extensions import override
 
 from sqlalchemy_hana._uuid import Uuid
 
+try:
+    import numpy
+except ImportError:  # pragma: no cover
+    numpy = None  # type: ignore[assignment,unused-ignore]
+
 if TYPE_CHECKING:
+    from numpy.typing import NDArray
+
     StrTypeEngine = TypeEngine[str]
 
 else:
     StrTypeEngine = TypeEngine
 
-_RV = TypeVar("_RV", tuple[float, ...], list[float], memoryview)
+_RV = TypeVar("_RV", tuple[float, ...], list[float], memoryview, "NDArray[Any]")
 
 
 class DATE(sqltypes.DATE):
@@ -191,9 +198,75 @@ class REAL_VECTOR(TypeEngine[_RV], Generic[_RV]):
 
     __visit_name__ = "REAL_VECTOR"
 
+    # numpy dtype of the vector elements in the binary format
+    _dtype = "<f4"
+
     def __init__(self, length: int | None = None) -> None:
         self.length = length
 
+    @override
+    def bind_processor(self, dialect: Dialect) -> Callable[[Any], Any] | None:
+        if numpy is None:
+            return None
+
+        def process(value: Any) -> Any:
+            if isinstance(value, numpy.ndarray):
+                return _ndarray_to_vector(value, self._dtype)
+            return value
+
+        return process
+
+    @override
+    def result_processor(
+        self, dialect: Dialect, coltype: object
+    ) -> Callable[[Any], Any] | None:
+        if getattr(dialect, "vector_output_type", None) != "numpy":
+            return None
+
+        def process(value: memoryview | None) -> NDArray[Any] | None:
+            if value is None:
+                return None
+            # skip the dimension header; the array shares the memory of the fetched value
+            return numpy.frombuffer(value, dtype=self._dtype, offset=4)
+
+        return process
+
+
+class HALF_VECTOR(REAL_VECTOR[_RV]):
+    """SAP HANA HALF_VECTOR type."""
+
+    __visit_name__ = "HALF_VECTOR"
+
+    _dtype = "<f2"
+
+
+class ST_GEOMETRY(TypeEngine[Any]):
+    """SAP HANA ST_GEOMETRY type."""
+
+    __visit_name__ = "ST_GEOMETRY"
+
+    def __init__(self, srid: int | None = None) -> None:
+        self.srid = srid
+
+
+class ST_POINT(ST_GEOMETRY):
+    """SAP HANA ST_POINT type."""
+
+    __visit_name__ = "ST_POINT"
+
+
+def _ndarray_to_vector(value: NDArray[Any], dtype: str) -> memoryview:
+    """Convert a numpy array into the binary format used by SAP HANA for vectors.
+
+    The format consists of the dimension as 4 byte integer followed by the values,
+    both in little endian.
+    For REAL_VECTOR, this is the fvecs format with 4 byte floats.
+    """
+    vector = numpy.ascontiguousarray(value, dtype=dtype)
+    if vector.ndim != 1:
+        raise ValueError("Vector values must be one-dimensional")
+    return memoryview(len(vector).to_bytes(4, "little") + vector.tobytes())
+
 
 __all__ = [
     "ALPHANUM",
@@ -206,6 +279,7 @@ __all__ = [
     "DECIMAL",
     "DOUBLE",
     "FLOAT",
+    "HALF_VECTOR",
     "INTEGER",
     "JSON",
     "LONGDATE",
@@ -217,6 +291,8 @@ __all__ = [
     "SECONDDATE",
     "SMALLDECIMAL",
     "SMALLINT",
+    "ST_GEOMETRY",
+    "ST_POINT",
     "TIME",
     "TIMESTAMP",
     "TINYINT",
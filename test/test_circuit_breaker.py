@@ -0,0 +1,144 @@
+"""Circuit breaker testing."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest import mock
+
+import pytest
+from hdbcli.dbapi import Error as HdbcliError
+from sqlalchemy.exc import ArgumentError, DBAPIError
+from sqlalchemy.testing.fixtures import TestBase
+
+from sqlalchemy_hana.circuit_breaker import (
+    CLOSED,
+    HALF_OPEN,
+    OPEN,
+    CircuitBreaker,
+    CircuitOpenError,
+)
+
+
+def _overloaded() -> DBAPIError:
+    return DBAPIError(
+        None,
+        None,
+        HdbcliError(129, "max number of SqlExecutor threads are exceeded"),
+    )
+
+
+class TestCircuitBreaker(TestBase):
+    def _breaker(self) -> tuple[CircuitBreaker, list[float], list[tuple[str, str]]]:
+        now = [0.0]
+        transitions: list[tuple[str, str]] = []
+        breaker = CircuitBreaker(
+            minimum_calls=4,
+            window_size=10,
+            reset_timeout=5,
+            listeners=[lambda old, new: transitions.append((old, new))],
+            clock=lambda: now[0],
+        )
+        return breaker, now, transitions
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"failure_rate": 0},
+            {"failure_rate": 1.5},
+            {"minimum_calls": 0},
+            {"minimum_calls": 200},
+            {"reset_timeout": -1},
+        ],
+    )
+    def test_invalid(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ArgumentError):
+            CircuitBreaker(**kwargs)  # type: ignore[arg-type]
+
+    def test_open(self) -> None:
+        breaker, _, transitions = self._breaker()
+        breaker.record(None)
+        breaker.record(_overloaded())
+        breaker.record(DBAPIError(None, None, HdbcliError(397, "invalid table name")))
+        assert breaker.state == CLOSED
+
+        breaker.record(_overloaded())
+        assert breaker.state == OPEN
+        assert transitions == [(CLOSED, OPEN)]
+        with pytest.raises(CircuitOpenError):
+            breaker._before_cursor_execute(mock.Mock(), None, "", None, None, False)
+        with pytest.raises(CircuitOpenError):
+            breaker._do_connect(mock.Mock(), mock.Mock(), (), {})
+
+    def test_window(self) -> None:
+        breaker, _, _ = self._breaker()
+        for _ in range(4):
+            breaker.record(_overloaded())
+            for _ in range(4):
+                breaker.record(None)
+        assert breaker.state == CLOSED
+
+    def test_probe(self) -> None:
+        breaker, now, transitions = self._breaker()
+        for _ in range(4):
+            breaker.record(_overloaded())
+        now[0] = 5
+        assert breaker.state == HALF_OPEN
+
+        connection = mock.Mock()
+        cursor = connection.connection.dbapi_connection.cursor.return_value
+        breaker._before_cursor_execute(connection, None, "", None, None, False)
+        cursor.execute.assert_called_once_with("SELECT 1 FROM DUMMY")
+        cursor.close.assert_called_once_with()
+        assert breaker.state == CLOSED
+        assert transitions == [(CLOSED, OPEN), (OPEN, HALF_OPEN), (HALF_OPEN, CLOSED)]
+
+    def test_probe_failure(self) -> None:
+        breaker, now, transitions = self._breaker()
+        for _ in range(4):
+            breaker.record(_overloaded())
+        now[0] = 5
+
+        connection = mock.Mock()
+        cursor = connection.connection.dbapi_connection.cursor.return_value
+        cursor.execute.side_effect = HdbcliError(4, "no memory")
+        with pytest.raises(CircuitOpenError):
+            breaker._before_cursor_execute(connection, None, "", None, None, False)
+        assert breaker.state == OPEN
+        assert transitions[-1] == (HALF_OPEN, OPEN)
+
+        now[0] = 9
+        assert breaker.state == OPEN
+        now[0] = 10
+        assert breaker.state == HALF_OPEN
+
+    @pytest.mark.parametrize(
+        "interruption", [KeyboardInterrupt, asyncio.CancelledError]
+    )
+    def test_probe_interrupted(self, interruption: type[BaseException]) -> None:
+        breaker, now, transitions = self._breaker()
+        for _ in range(4):
+            breaker.record(_overloaded())
+        now[0] = 5
+
+        connection = mock.Mock()
+        cursor = connection.connection.dbapi_connection.cursor.return_value
+        cursor.execute.side_effect = interruption
+        with pytest.raises(interruption):
+            breaker._before_cursor_execute(connection, None, "", None, None, False)
+        cursor.close.assert_called_once_with()
+        assert breaker.state == OPEN
+        assert transitions[-1] == (HALF_OPEN, OPEN)
+
+        # the next probe is sent once the timeout expired again
+        now[0] = 10
+        cursor.execute.side_effect = None
+        breaker._before_cursor_execute(connection, None, "", None, None, False)
+        assert breaker.state == CLOSED
+
+    def test_reset(self) -> None:
+        breaker, _, _ = self._breaker()
+        for _ in range(4):
+            breaker.record(_overloaded())
+        breaker.reset()
+        assert breaker.state == CLOSED
+        breaker._before_cursor_execute(mock.Mock(), None, "", None, None, False)
@@ -0,0 +1,123 @@
+"""Tests for sqlalchemy_hana.columnar."""
+
+from __future__ import annotations
+
+import array
+import uuid
+from decimal import Decimal
+
+import pytest
+from sqlalchemy import Integer, Numeric, String, Uuid, select, text
+from sqlalchemy.exc import ArgumentError, ResourceClosedError
+from sqlalchemy.testing.fixtures import TablesTest
+from sqlalchemy.testing.schema import Column, Table
+
+from sqlalchemy_hana.columnar import fetch_columns
+
+UUID = uuid.UUID("f2a7c2a6-31b8-4e27-8b0e-5a1f4ad3e1e5")
+
+
+class FetchColumnsTest(TablesTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "columnar_table",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("amount", Numeric(10, 2)),
+            Column("ratio", Numeric(10, 2, asdecimal=False)),
+            Column("uid", Uuid),
+            Column("name", String(10)),
+            Column("quantity", Integer),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.columnar_table.insert(),
+            [
+                {
+                    "id": i,
+                    "amount": Decimal(i),
+                    "ratio": i / 2,
+                    "uid": UUID,
+                    "name": f"name{i}" if i % 2 else None,
+                    "quantity": i if i < 5 else None,
+                }
+                for i in range(1, 6)
+            ],
+        )
+
+    def _select(self):
+        table = self.tables.columnar_table
+        return select(table).order_by(table.c.id)
+
+    def test_python_columns(self, connection):
+        batches = list(
+            fetch_columns(connection.execute(self._select()), 2, arrow=False)
+        )
+        assert len(batches) == 3
+
+        first = batches[0]
+        assert list(first) == ["id", "amount", "ratio", "uid", "name", "quantity"]
+        assert first["id"] == array.array("q", [1, 2])
+        assert first["amount"] == [Decimal(1), Decimal(2)]
+        assert first["ratio"] == [0.5, 1.0]
+        assert first["uid"] == [UUID, UUID]
+        assert first["name"] == ["name1", None]
+        assert list(batches[2]["id"]) == [5]
+
+    def test_python_column_types(self, connection):
+        table = self.tables.columnar_table
+        result = connection.execute(
+            select(table.c.id, table.c.quantity).order_by(table.c.id)
+        )
+        batches = list(fetch_columns(result, 2, arrow=False))
+
+        # the container of a column does not depend on the values of a batch
+        assert [type(batch["id"]) for batch in batches] == [array.array] * 3
+        assert [type(batch["quantity"]) for batch in batches] == [list] * 3
+        assert [batch["quantity"] for batch in batches] == [[1, 2], [3, 4], [None]]
+
+    def test_arrow(self, connection):
+        pyarrow = pytest.importorskip("pyarrow")
+
+        batches = list(fetch_columns(connection.execute(self._select()), 3, arrow=True))
+        assert [batch.num_rows for batch in batches] == [3, 2]
+        assert batches[0].schema.names == [
+            "id",
+            "amount",
+            "ratio",
+            "uid",
+            "name",
+            "quantity",
+        ]
+
+        table = pyarrow.Table.from_batches(batches)
+        assert table.column("id").to_pylist() == [1, 2, 3, 4, 5]
+        assert table.column("ratio").to_pylist() == [0.5, 1.0, 1.5, 2.0, 2.5]
+        assert table.column("name").null_count == 2
+
+    def test_remaining_rows(self, connection):
+        result = connection.execute(self._select())
+        result.fetchone()
+        batches = list(fetch_columns(result, 10, arrow=False))
+        assert list(batches[0]["id"]) == [2, 3, 4, 5]
+
+    def test_stream_results(self, connection):
+        result = connection.execution_options(
+            stream_results=True, hana_fetch_size=2
+        ).execute(self._select())
+        batches = list(fetch_columns(result, 2, arrow=False))
+        assert [len(batch["id"]) for batch in batches] == [2, 2, 1]
+
+    def test_invalid_batch_size(self, connection):
+        with pytest.raises(ArgumentError, match="batch_size"):
+            next(fetch_columns(connection.execute(self._select()), 0))
+
+    def test_no_rows(self, connection):
+        result = connection.execute(
+            text("UPDATE columnar_table SET name = 'other' WHERE id = 1")
+        )
+        with pytest.raises(ResourceClosedError):
+            next(fetch_columns(result))
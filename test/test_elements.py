@@ -2,12 +2,23 @@
 
 from __future__ import annotations
 
+import pytest
 from sqlalchemy import Column, Integer, String, Table, inspect, select
+from sqlalchemy.engine.interfaces import CacheStats
+from sqlalchemy.exc import ArgumentError, CompileError
 from sqlalchemy.orm import Session, declarative_base
 from sqlalchemy.testing.config import fixture
 from sqlalchemy.testing.fixtures import TablesTest
 
-from sqlalchemy_hana.elements import CreateView, DropView, upsert, view
+from sqlalchemy_hana.elements import (
+    CreateView,
+    DropView,
+    merge_into,
+    top_k_similar,
+    upsert,
+    view,
+)
+from sqlalchemy_hana.types import REAL_VECTOR
 
 
 class TestViews(TablesTest):
@@ -117,3 +128,190 @@ class TestUpsert(TablesTest):
             (2, "dataX"),
             (3, "data3"),
         ]
+
+    def test_upsert_with_primary_key(self, connection):
+        table = self.tables.test_table
+        connection.execute(upsert(table).values(id=2, value="dataX").with_primary_key())
+        connection.execute(upsert(table).values(id=4, value="data4").with_primary_key())
+
+        select_stmt = select(table.c.id, table.c.value).order_by(table.c.id)
+        assert connection.execute(select_stmt).all() == [
+            (1, "data1"),
+            (2, "dataX"),
+            (3, "data3"),
+            (4, "data4"),
+        ]
+
+    def test_upsert_with_primary_key_and_where(self, connection):
+        table = self.tables.test_table
+        stmt = upsert(table).values(id=2, value="dataX").with_primary_key()
+        with pytest.raises(CompileError, match="WITH PRIMARY KEY"):
+            connection.execute(stmt.filter_by(id=2))
+
+    def test_upsert_cache_key(self):
+        table = self.tables.test_table
+
+        def _key(stmt):
+            return stmt._generate_cache_key().key
+
+        base = upsert(table).values(id=1, value="data1")
+        assert _key(base.filter_by(id=1)) == _key(
+            upsert(table).values(id=2, value="data2").filter_by(id=2)
+        )
+        assert _key(base) != _key(base.filter_by(id=1))
+        assert _key(base.filter_by(id=1)) != _key(base.filter_by(value="data1"))
+        assert _key(base) != _key(base.with_primary_key())
+
+    def test_upsert_cache_hit(self, connection):
+        table = self.tables.test_table
+
+        results = [
+            connection.execute(
+                upsert(table).values(id=i, value=f"data{i}").filter_by(id=i)
+            )
+            for i in range(2, 5)
+        ]
+        assert results[1].context.compiled is results[0].context.compiled
+        assert results[2].context.compiled is results[0].context.compiled
+        assert [r.context.cache_hit for r in results[1:]] == [
+            CacheStats.CACHE_HIT,
+            CacheStats.CACHE_HIT,
+        ]
+
+        select_stmt = select(table.c.id, table.c.value).order_by(table.c.id)
+        assert connection.execute(select_stmt).all() == [
+            (1, "data1"),
+            (2, "data2"),
+            (3, "data3"),
+            (4, "data4"),
+        ]
+
+    def test_upsert_batches(self, connection):
+        table = self.tables.test_table
+        result = connection.execute(
+            upsert(table, batch_size=2).with_primary_key(),
+            [{"id": i, "value": f"data{i}"} for i in range(2, 7)],
+        )
+        # the rowcount covers all batches
+        assert result.rowcount == 5
+
+        select_stmt = select(table.c.id, table.c.value).order_by(table.c.id)
+        assert connection.execute(select_stmt).all() == [
+            (1, "data1"),
+            (2, "data2"),
+            (3, "data3"),
+            (4, "data4"),
+            (5, "data5"),
+            (6, "data6"),
+        ]
+
+    def test_upsert_invalid_batch_size(self):
+        with pytest.raises(ArgumentError, match="batch_size"):
+            upsert(self.tables.test_table, batch_size=0)
+
+
+class TestMergeInto(TablesTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "target_table",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("value", String(10)),
+        )
+        Table(
+            "source_table",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("value", String(10)),
+            Column("deleted", Integer),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.target_table.insert(),
+            [
+                {"id": 1, "value": "data1"},
+                {"id": 2, "value": "data2"},
+                {"id": 3, "value": "data3"},
+            ],
+        )
+        connection.execute(
+            cls.tables.source_table.insert(),
+            [
+                {"id": 2, "value": "dataX", "deleted": 0},
+                {"id": 3, "value": "data3", "deleted": 1},
+                {"id": 4, "value": "data4", "deleted": 0},
+                {"id": 5, "value": "data5", "deleted": 1},
+            ],
+        )
+
+    def _merge(self, connection, source):
+        target = self.tables.target_table
+        connection.execute(
+            merge_into(target, source, target.c.id == source.c.id)
+            .when_matched_then_delete(condition=source.c.deleted == 1)
+            .when_matched_then_update({"value": source.c.value})
+            .when_not_matched_then_insert(
+                {"id": source.c.id, "value": source.c.value},
+                condition=source.c.deleted == 0,
+            )
+        )
+
+        select_stmt = select(target.c.id, target.c.value).order_by(target.c.id)
+        return connection.execute(select_stmt).all()
+
+    def test_merge_table(self, connection):
+        assert self._merge(connection, self.tables.source_table) == [
+            (1, "data1"),
+            (2, "dataX"),
+            (4, "data4"),
+        ]
+
+    def test_merge_subquery(self, connection):
+        source = self.tables.source_table
+        subquery = select(source).where(source.c.id > 2).subquery()
+        assert self._merge(connection, subquery) == [
+            (1, "data1"),
+            (2, "data2"),
+            (4, "data4"),
+        ]
+
+    def test_merge_cte(self, connection):
+        source = self.tables.source_table
+        cte = select(source).where(source.c.id < 4).cte("delta")
+        assert self._merge(connection, cte) == [
+            (1, "data1"),
+            (2, "dataX"),
+        ]
+
+
+class TestTopKSimilar(TablesTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "vector_table",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("vec", REAL_VECTOR(length=3)),
+        )
+
+    @classmethod
+    def insert_data(cls, connection):
+        connection.execute(
+            cls.tables.vector_table.insert(),
+            [{"id": i, "vec": [float(i), 0.0, 1.0]} for i in range(10)],
+        )
+
+    def test_l2distance(self, connection):
+        table = self.tables.vector_table
+        rows = connection.execute(
+            top_k_similar(table.c.vec, [4.2, 0.0, 1.0], 3, "L2DISTANCE")
+        ).all()
+        assert [row.id for row in rows] == [4, 5, 3]
+
+    def test_cosine_similarity(self, connection):
+        table = self.tables.vector_table
+        rows = connection.execute(top_k_similar(table.c.vec, "[0, 0, 1]", 2)).all()
+        assert [row.id for row in rows] == [0, 1]
@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import pytest
 from hdbcli.dbapi import Error as HdbcliError
-from sqlalchemy.exc import DBAPIError
+from sqlalchemy.exc import ArgumentError, DBAPIError
 from sqlalchemy.testing.fixtures import TestBase
 
 from sqlalchemy_hana.errors import (
@@ -14,6 +14,7 @@ from sqlalchemy_hana.errors import (
     DatabaseOverloadedError,
     DeadlockError,
     DistributedTransactionCommitFailureError,
+    ErrorRule,
     InvalidObjectNameError,
     LockAcquisitionError,
     LockWaitTimeoutError,
@@ -26,6 +27,271 @@ from sqlalchemy_hana.errors import (
     TransactionCancelledError,
     WriteInReadOnlyReplicationError,
     convert_dbapi_error,
+    register_error_rule,
+    unregister_error_rule,
+)
+
+# hdbcli errors which are converted by their code regardless of the error text
+_CONNECTION_ERRORS = {
+    -10807: ClientConnectionError,
+    -10735: ClientConnectionError,
+    -10709: ClientConnectionError,
+}
+_CODE_ERRORS = {
+    **_CONNECTION_ERRORS,
+    4: DatabaseOutOfMemoryError,
+    129: StatementExecutionError,
+    131: LockWaitTimeoutError,
+    133: DeadlockError,
+    145: StatementExecutionError,
+    146: LockAcquisitionError,
+    149: DistributedTransactionCommitFailureError,
+    397: InvalidObjectNameError,
+    597: SessionContextError,
+    613: StatementTimeoutError,
+    1888: DatabaseConnectNotPossibleError,
+}
+
+# every error text is combined with every error code; per text, the expected exception class of
+# the codes which are not converted to the default class, None if the error is not converted
+_CORPUS_CODES = (
+    -10807,
+    -10735,
+    -10709,
+    -10800,
+    0,
+    2,
+    4,
+    7,
+    128,
+    129,
+    131,
+    133,
+    139,
+    145,
+    146,
+    149,
+    259,
+    397,
+    597,
+    613,
+    663,
+    1888,
+    99999,
+)
+_CORPUS: tuple[tuple[str, type[Exception] | None, dict[int, type[Exception]]], ...] = (
+    ("", None, _CODE_ERRORS),
+    ("some error", None, _CODE_ERRORS),
+    (
+        "Lock timeout occurs while waiting sequence cache lock",
+        SequenceCacheTimeoutError,
+        {**_CONNECTION_ERRORS, 613: StatementTimeoutError},
+    ),
+    (
+        "transaction rolled back: Lock timeout occurs while waiting sequence lock",
+        None,
+        {**_CODE_ERRORS, 131: SequenceLockTimeoutError},
+    ),
+    (
+        "current operation cancelled by request and transaction rolled back",
+        None,
+        {**_CODE_ERRORS, 139: TransactionCancelledError},
+    ),
+    (
+        "max number of SqlExecutor threads are exceeded",
+        None,
+        {**_CODE_ERRORS, 129: DatabaseOverloadedError},
+    ),
+    (
+        "OutOfMemory exception",
+        DatabaseOutOfMemoryError,
+        {
+            **_CONNECTION_ERRORS,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+        },
+    ),
+    (
+        "cannot allocate enough memory",
+        DatabaseOutOfMemoryError,
+        {
+            **_CONNECTION_ERRORS,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+        },
+    ),
+    (
+        "Allocation failed",
+        DatabaseOutOfMemoryError,
+        {
+            **_CONNECTION_ERRORS,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+        },
+    ),
+    (
+        "Error GBA503: Service is unavailable",
+        None,
+        {**_CODE_ERRORS, 663: DatabaseConnectNotPossibleError},
+    ),
+    (
+        "HANA Cloud region is in maintenance window",
+        DatabaseConnectNotPossibleError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+        },
+    ),
+    (
+        "HANA Database instance upgrade in progress",
+        DatabaseConnectNotPossibleError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+        },
+    ),
+    (
+        "HANA Database instance resize in progress",
+        DatabaseConnectNotPossibleError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+        },
+    ),
+    ("HANA Database instance resize in progress: retry later", None, _CODE_ERRORS),
+    (
+        "TransactionManager is not yet fully initialized",
+        DatabaseConnectNotPossibleError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+        },
+    ),
+    (
+        "An error occurred while opening the channel",
+        StatementExecutionError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+            1888: DatabaseConnectNotPossibleError,
+        },
+    ),
+    (
+        "Exception in executor plan",
+        StatementExecutionError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+            1888: DatabaseConnectNotPossibleError,
+        },
+    ),
+    (
+        "DTX commit(first phase commit) failed",
+        StatementExecutionError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+            1888: DatabaseConnectNotPossibleError,
+        },
+    ),
+    (
+        "An error occurred while reading from the channel",
+        StatementExecutionError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+            1888: DatabaseConnectNotPossibleError,
+        },
+    ),
+    (
+        "temp index not exists",
+        StatementExecutionError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            146: LockAcquisitionError,
+            613: StatementTimeoutError,
+            1888: DatabaseConnectNotPossibleError,
+        },
+    ),
+    (
+        "feature not supported: writable statement not allowed in read-enabled replication",
+        WriteInReadOnlyReplicationError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            129: StatementExecutionError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            145: StatementExecutionError,
+            146: LockAcquisitionError,
+            397: InvalidObjectNameError,
+            613: StatementTimeoutError,
+            1888: DatabaseConnectNotPossibleError,
+        },
+    ),
+    (
+        "error: feature not supported: writable statement not allowed in read-enabled replication",
+        None,
+        _CODE_ERRORS,
+    ),
+    (
+        "exceed maximum number of transactions",
+        NumberOfTransactionsExceededError,
+        {
+            **_CONNECTION_ERRORS,
+            4: DatabaseOutOfMemoryError,
+            129: StatementExecutionError,
+            131: LockWaitTimeoutError,
+            133: DeadlockError,
+            145: StatementExecutionError,
+            146: LockAcquisitionError,
+            397: InvalidObjectNameError,
+            597: SessionContextError,
+            613: StatementTimeoutError,
+            1888: DatabaseConnectNotPossibleError,
+        },
+    ),
 )
 
 
@@ -131,3 +397,51 @@ class TestConvertDBAPIError(TestBase):
         dbapi_error = DBAPIError(None, None, error)
         assert convert_dbapi_error(dbapi_error) is dbapi_error
         assert convert_dbapi_error(dbapi_error) is dbapi_error
+
+    @pytest.mark.parametrize(
+        "errorcode,errortext,expected_exception",
+        [
+            (errorcode, errortext, errors.get(errorcode, default))
+            for errortext, default, errors in _CORPUS
+            for errorcode in _CORPUS_CODES
+        ],
+    )
+    def test_convert_dbapi_error_corpus(
+        self,
+        errorcode: int,
+        errortext: str,
+        expected_exception: type[Exception] | None,
+    ) -> None:
+        dbapi_error = DBAPIError(None, None, HdbcliError(errorcode, errortext))
+        converted = convert_dbapi_error(dbapi_error)
+        if expected_exception is None:
+            assert converted is dbapi_error
+        else:
+            assert converted.__class__ is expected_exception
+
+    def test_register_error_rule(self) -> None:
+        dbapi_error = DBAPIError(None, None, HdbcliError(123, "site specific error"))
+        rule = register_error_rule(DatabaseOverloadedError, codes=[123])
+        try:
+            assert isinstance(convert_dbapi_error(dbapi_error), DatabaseOverloadedError)
+        finally:
+            unregister_error_rule(rule)
+        assert convert_dbapi_error(dbapi_error) is dbapi_error
+
+    def test_register_error_rule_precedence(self) -> None:
+        dbapi_error = DBAPIError(None, None, HdbcliError(133, "deadlock on site"))
+        first = register_error_rule(LockAcquisitionError, texts=["on site"])
+        second = register_error_rule(StatementExecutionError, pattern=r"dead\w+")
+        try:
+            assert isinstance(convert_dbapi_error(dbapi_error), LockAcquisitionError)
+        finally:
+            unregister_error_rule(first)
+        try:
+            assert isinstance(convert_dbapi_error(dbapi_error), StatementExecutionError)
+        finally:
+            unregister_error_rule(second)
+        assert isinstance(convert_dbapi_error(dbapi_error), DeadlockError)
+
+    def test_error_rule_without_condition(self) -> None:
+        with pytest.raises(ArgumentError):
+            ErrorRule(DeadlockError)
@@ -2,13 +2,27 @@
 
 from __future__ import annotations
 
-from sqlalchemy import Integer, String, create_engine, inspect
+import json
+
+import pytest
+from sqlalchemy import (
+    ForeignKey,
+    Index,
+    Integer,
+    MetaData,
+    String,
+    create_engine,
+    event,
+    inspect,
+)
 from sqlalchemy.engine import Connection, Engine
+from sqlalchemy.exc import ArgumentError
 from sqlalchemy.testing import config, eq_, is_true
 from sqlalchemy.testing.fixtures import TablesTest
 from sqlalchemy.testing.schema import Column, Table
 
 from sqlalchemy_hana.dialect import HANAInspector
+from sqlalchemy_hana.types import REAL_VECTOR
 
 
 class InspectorTest(TablesTest):
@@ -21,6 +35,12 @@ class InspectorTest(TablesTest):
             Column("id", Integer, primary_key=True, autoincrement=True),
             Column("desc", String(100)),
         )
+        Table(
+            "tbl_child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("tbl_id", Integer, ForeignKey("tbl.id")),
+        )
 
     def test_get_table_oid(self, connection):
         connection_inspector = inspect(connection)
@@ -45,3 +65,169 @@ class InspectorTest(TablesTest):
         is_true(isinstance(table_oid2, int))
 
         eq_(table_oid1, table_oid2)
+
+    def test_get_multi_reflection_round_trips(self, connection):
+        statements = []
+
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        insp = inspect(connection)
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            columns = insp.get_multi_columns()
+            pk_constraints = insp.get_multi_pk_constraint()
+            foreign_keys = insp.get_multi_foreign_keys()
+            indexes = insp.get_multi_indexes()
+            unique_constraints = insp.get_multi_unique_constraints()
+            check_constraints = insp.get_multi_check_constraints()
+            table_comments = insp.get_multi_table_comment()
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+
+        # one query for the object names and one query per reflected category
+        eq_(len(statements), 8)
+
+        for result in (
+            columns,
+            pk_constraints,
+            foreign_keys,
+            indexes,
+            unique_constraints,
+            check_constraints,
+            table_comments,
+        ):
+            is_true((None, "tbl") in result)
+            is_true((None, "tbl_child") in result)
+
+        eq_([col["name"] for col in columns[(None, "tbl")]], ["id", "desc"])
+        eq_(pk_constraints[(None, "tbl_child")]["constrained_columns"], ["id"])
+        eq_(foreign_keys[(None, "tbl_child")][0]["referred_table"], "tbl")
+        eq_(foreign_keys[(None, "tbl")], [])
+
+    def test_reflection_cache(self, tmp_path):
+        engine = create_engine(config.db.url, reflection_cache_dir=tmp_path)
+        statements = []
+
+        @event.listens_for(engine, "before_cursor_execute")
+        def _record(conn, cursor, statement, *args):
+            statements.append(statement)
+
+        MetaData().reflect(engine, only=["tbl", "tbl_child"])
+        statements.clear()
+
+        cached = MetaData()
+        cached.reflect(engine, only=["tbl", "tbl_child"])
+        # only the fingerprint of the schema is queried
+        eq_(len(statements), 1)
+        eq_([col.name for col in cached.tables["tbl"].c], ["id", "desc"])
+        eq_(
+            {fk.target_fullname for fk in cached.tables["tbl_child"].foreign_keys},
+            {"tbl.id"},
+        )
+
+        with engine.begin() as conn:
+            conn.exec_driver_sql("ALTER TABLE tbl ADD (extra INTEGER)")
+        try:
+            statements.clear()
+            changed = MetaData()
+            changed.reflect(engine, only=["tbl", "tbl_child"])
+            is_true(len(statements) > 1)
+            eq_(
+                [col.name for col in changed.tables["tbl"].c],
+                ["id", "desc", "extra"],
+            )
+
+            # changes keeping all counts and lengths are detected as well
+            for comment in ("one", "two"):
+                with engine.begin() as conn:
+                    conn.exec_driver_sql(f"COMMENT ON COLUMN tbl.extra IS '{comment}'")
+                commented = MetaData()
+                commented.reflect(engine, only=["tbl", "tbl_child"])
+                eq_(commented.tables["tbl"].c.extra.comment, comment)
+        finally:
+            with engine.begin() as conn:
+                conn.exec_driver_sql("ALTER TABLE tbl DROP (extra)")
+            engine.dispose()
+
+
+class ReflectSchemasTest(TablesTest):
+
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "parent",
+            metadata,
+            Column("id", Integer, primary_key=True),
+        )
+        Table(
+            "child",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("parent_id", Integer, ForeignKey("parent.id")),
+            schema=config.test_schema,
+        )
+
+    def test_reflect_schemas(self):
+        insp = inspect(config.db)
+        metadata = insp.reflect_schemas([None, config.test_schema], max_workers=2)
+
+        is_true("parent" in metadata.tables)
+        child = metadata.tables[f"{config.test_schema}.child"]
+        eq_([col.name for col in child.c], ["id", "parent_id"])
+        eq_(
+            [fk.column for fk in child.c.parent_id.foreign_keys],
+            [metadata.tables["parent"].c.id],
+        )
+
+    def test_reflect_schemas_into_metadata(self):
+        metadata = MetaData()
+        parent = Table("parent", metadata, Column("id", Integer, primary_key=True))
+
+        inspect(config.db).reflect_schemas(
+            [None, config.test_schema], metadata, max_workers=1
+        )
+        is_true(metadata.tables["parent"] is parent)
+        is_true(f"{config.test_schema}.child" in metadata.tables)
+
+    def test_reflect_schemas_requires_engine(self, connection):
+        with pytest.raises(ArgumentError, match="bound to an engine"):
+            inspect(connection).reflect_schemas([None])
+
+    def test_reflect_schemas_invalid_max_workers(self):
+        with pytest.raises(ArgumentError, match="max_workers"):
+            inspect(config.db).reflect_schemas([None], max_workers=0)
+
+
+class VectorIndexTest(TablesTest):
+
+    @classmethod
+    def define_tables(cls, metadata):
+        table = Table(
+            "vector_tbl",
+            metadata,
+            Column("id", Integer, primary_key=True),
+            Column("vec", REAL_VECTOR(length=3)),
+        )
+        if config.db.dialect.supports_vector_indexes:
+            Index(
+                "vector_tbl_vec_idx",
+                table.c.vec,
+                hana_index_type="HNSW",
+                hana_similarity_function="L2DISTANCE",
+                hana_build_configuration={"M": 32},
+            )
+
+    def test_get_indexes(self, connection):
+        if not connection.dialect.supports_vector_indexes:
+            pytest.skip("vector indexes are not supported by the database")
+
+        indexes = inspect(connection).get_indexes("vector_tbl")
+        eq_(len(indexes), 1)
+        eq_(indexes[0]["name"], "vector_tbl_vec_idx")
+        eq_(indexes[0]["column_names"], ["vec"])
+
+        dialect_options = indexes[0]["dialect_options"]
+        eq_(dialect_options["hana_index_type"], "HNSW")
+        eq_(dialect_options["hana_similarity_function"], "L2DISTANCE")
+        eq_(json.loads(dialect_options["hana_build_configuration"])["M"], 32)
@@ -0,0 +1,71 @@
+"""Tests for sqlalchemy_hana.orm."""
+
+from __future__ import annotations
+
+from sqlalchemy import Identity, Integer, Sequence, String, event, select
+from sqlalchemy.orm import Session, registry
+from sqlalchemy.testing.assertions import eq_
+from sqlalchemy.testing.fixtures import TablesTest
+from sqlalchemy.testing.schema import Column, Table
+
+from sqlalchemy_hana.orm import enable_primary_key_prefetch
+
+
+class PrimaryKeyPrefetchTest(TablesTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "seq_table",
+            metadata,
+            Column("id", Integer, Sequence("seq_table_id_seq"), primary_key=True),
+            Column("value", String(10)),
+        )
+        Table(
+            "identity_table",
+            metadata,
+            Column("id", Integer, Identity(), primary_key=True),
+            Column("value", String(10)),
+        )
+
+    def _flush(self, connection, table):
+        mapper_registry = registry()
+
+        class Model:
+            def __init__(self, value):
+                self.value = value
+
+        mapper_registry.map_imperatively(Model, table)
+
+        statements = []
+
+        def _record(conn, cursor, statement, parameters, context, executemany):
+            if statement.startswith("INSERT"):
+                statements.append(executemany)
+
+        session = Session(connection)
+        enable_primary_key_prefetch(session)
+
+        objects = [Model(value=f"data{i}") for i in range(10)]
+        session.add_all(objects)
+
+        event.listen(connection, "before_cursor_execute", _record)
+        try:
+            session.flush()
+        finally:
+            event.remove(connection, "before_cursor_execute", _record)
+            mapper_registry.dispose()
+
+        ids = [obj.id for obj in objects]
+        eq_(len(set(ids)), 10)
+        eq_(ids, sorted(ids))
+        eq_(statements, [True])
+        eq_(
+            connection.execute(select(table.c.id).order_by(table.c.id)).scalars().all(),
+            ids,
+        )
+
+    def test_sequence(self, connection):
+        self._flush(connection, self.tables.seq_table)
+
+    def test_identity(self, connection):
+        self._flush(connection, self.tables.identity_table)
@@ -0,0 +1,174 @@
+"""Retry testing."""
+
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from hdbcli.dbapi import Error as HdbcliError
+from sqlalchemy.exc import ArgumentError, DBAPIError
+from sqlalchemy.testing.fixtures import TestBase
+
+from sqlalchemy_hana.errors import DeadlockError, LockWaitTimeoutError
+from sqlalchemy_hana.retry import (  # pylint: disable=import-private-name
+    DEFAULT_POLICIES,
+    RetryEvent,
+    Retrying,
+    RetryPolicy,
+    _convert_error,
+    retry_transaction,
+)
+
+
+def _error(errorcode: int, errortext: str = "") -> DBAPIError:
+    return DBAPIError("SELECT 1 FROM DUMMY", None, HdbcliError(errorcode, errortext))
+
+
+class FailingFunction:
+    def __init__(self, *errors: BaseException) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self) -> str:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return "ok"
+
+
+class TestRetryPolicy(TestBase):
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"max_attempts": 0},
+            {"initial_backoff": -1},
+            {"max_backoff": -1},
+            {"multiplier": 0.5},
+        ],
+    )
+    def test_invalid(self, kwargs: dict[str, float]) -> None:
+        with pytest.raises(ArgumentError):
+            RetryPolicy(**kwargs)  # type: ignore[arg-type]
+
+    def test_backoff(self) -> None:
+        policy = RetryPolicy(initial_backoff=0.1, max_backoff=0.3, multiplier=2)
+        with mock.patch("random.uniform", side_effect=lambda a, b: b):
+            assert [policy.backoff(n) for n in range(1, 5)] == pytest.approx(
+                [0.1, 0.2, 0.3, 0.3]
+            )
+
+
+class TestRetrying(TestBase):
+    def test_retry(self) -> None:
+        events: list[RetryEvent] = []
+        sleep = mock.Mock()
+        fn = FailingFunction(_error(133), _error(131))
+        retrier = Retrying(listeners=[events.append], sleep=sleep)
+
+        assert retrier.call(fn) == "ok"
+        assert fn.calls == 3
+        assert [event.attempt for event in events] == [1, 2]
+        assert isinstance(events[0].error, DeadlockError)
+        assert isinstance(events[1].error, LockWaitTimeoutError)
+        assert [call.args[0] for call in sleep.call_args_list] == [
+            event.delay for event in events
+        ]
+
+    def test_give_up(self) -> None:
+        events: list[RetryEvent] = []
+        errors = [_error(131) for _ in range(3)]
+        fn = FailingFunction(*errors)
+        retrier = Retrying(listeners=[events.append], sleep=mock.Mock())
+
+        with pytest.raises(DBAPIError) as exc_info:
+            retrier.call(fn)
+        assert exc_info.value is errors[-1]
+        assert fn.calls == DEFAULT_POLICIES[LockWaitTimeoutError].max_attempts
+        assert events[-1].delay is None
+
+    def test_no_policy(self) -> None:
+        sleep = mock.Mock()
+        error = _error(397)
+        fn = FailingFunction(error)
+
+        with pytest.raises(DBAPIError) as exc_info:
+            Retrying(sleep=sleep).call(fn)
+        assert exc_info.value is error
+        assert fn.calls == 1
+        sleep.assert_not_called()
+
+    def test_other_error(self) -> None:
+        fn = FailingFunction(ValueError())
+        with pytest.raises(ValueError):
+            Retrying(sleep=mock.Mock()).call(fn)
+        assert fn.calls == 1
+
+    def test_policies(self) -> None:
+        fn = FailingFunction(*[_error(133) for _ in range(5)])
+        retrier = Retrying({DBAPIError: RetryPolicy(max_attempts=6)}, sleep=mock.Mock())
+        assert retrier.call(fn) == "ok"
+        assert fn.calls == 6
+
+    def test_deadline(self) -> None:
+        sleep = mock.Mock()
+        fn = FailingFunction(_error(133), _error(133))
+        retrier = Retrying(
+            {DeadlockError: RetryPolicy(max_attempts=5, initial_backoff=10)},
+            deadline=1,
+            sleep=sleep,
+        )
+        with mock.patch("random.uniform", side_effect=lambda a, b: b):
+            with pytest.raises(DBAPIError):
+                retrier.call(fn)
+        assert fn.calls == 1
+        sleep.assert_not_called()
+
+    def test_context_manager(self) -> None:
+        fn = FailingFunction(_error(133))
+        attempts = []
+        results = []
+        for attempt in Retrying(sleep=mock.Mock()):
+            attempts.append(attempt)
+            with attempt:
+                results.append(fn())
+        assert results == ["ok"]
+        assert [attempt.number for attempt in attempts] == [1, 2]
+
+    def test_decorator(self) -> None:
+        fn = FailingFunction(_error(133))
+
+        @Retrying(sleep=mock.Mock())
+        def decorated(value: int) -> tuple[str, int]:
+            return fn(), value
+
+        assert decorated(1) == ("ok", 1)
+        assert fn.calls == 2
+
+
+class TestRetryTransaction(TestBase):
+    def test_retry_transaction(self) -> None:
+        bind = mock.MagicMock()
+        fn = mock.Mock(side_effect=[_error(133), "ok"])
+
+        assert retry_transaction(bind, fn, Retrying(sleep=mock.Mock())) == "ok"
+        assert bind.begin.call_count == 2
+        unit = bind.begin.return_value.__enter__.return_value
+        fn.assert_called_with(unit)
+
+
+class TestErrorConversion(TestBase):
+    def test_convert_error(self) -> None:
+        error = _error(133)
+        error.connection_invalidated = True
+        context = mock.Mock(sqlalchemy_exception=error)
+
+        converted = _convert_error(context)
+        assert isinstance(converted, DeadlockError)
+        assert converted.connection_invalidated
+
+        context.sqlalchemy_exception = converted
+        assert _convert_error(context) is None
+
+    def test_convert_error_no_wrap(self) -> None:
+        context = mock.Mock(sqlalchemy_exception=_error(123, "some error"))
+        assert _convert_error(context) is None
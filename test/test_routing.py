@@ -0,0 +1,156 @@
+"""Read replica routing testing."""
+
+from __future__ import annotations
+
+import threading
+from unittest import mock
+
+import pytest
+from hdbcli.dbapi import Error as HdbcliError
+from sqlalchemy import create_engine
+from sqlalchemy.exc import DBAPIError
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.testing.fixtures import TestBase
+
+from sqlalchemy_hana.routing import ReplicaRouter, RoutingSession
+
+
+def _engine_with_lag(lag: float | None) -> mock.MagicMock:
+    engine = mock.MagicMock()
+    connection = engine.connect.return_value.__enter__.return_value
+    connection.execute.return_value.scalar.return_value = lag
+    return engine
+
+
+class TestReplicaRouter(TestBase):
+    def test_get_engine(self) -> None:
+        primary, replica1, replica2 = mock.Mock(), mock.Mock(), mock.Mock()
+        router = ReplicaRouter(primary, [replica1, replica2])
+        assert [router.get_engine(True) for _ in range(3)] == [
+            replica1,
+            replica2,
+            replica1,
+        ]
+        assert router.get_engine(False) is primary
+        assert ReplicaRouter(primary, []).get_engine(True) is primary
+
+    def test_replication_lag(self) -> None:
+        now = [0.0]
+        primary, replica = _engine_with_lag(1), mock.Mock()
+        router = ReplicaRouter(
+            primary, [replica], max_lag=5, lag_check_interval=10, clock=lambda: now[0]
+        )
+        assert router.get_engine(True) is replica
+
+        connection = primary.connect.return_value.__enter__.return_value
+        connection.execute.return_value.scalar.return_value = 6
+        now[0] = 9
+        assert router.get_engine(True) is replica
+        now[0] = 10
+        assert router.get_engine(True) is primary
+        assert primary.connect.call_count == 2
+
+    def test_replication_lag_unknown(self) -> None:
+        primary, replica = _engine_with_lag(None), mock.Mock()
+        router = ReplicaRouter(primary, [replica], max_lag=5)
+        assert router.replication_lag() is None
+        assert router.get_engine(True) is primary
+
+    def test_replication_lag_error(self) -> None:
+        primary, replica = mock.MagicMock(), mock.Mock()
+        connection = primary.connect.return_value.__enter__.return_value
+        connection.execute.side_effect = DBAPIError(None, None, HdbcliError(258, ""))
+        router = ReplicaRouter(primary, [replica], max_lag=5)
+        assert router.replication_lag() is None
+        assert router.get_engine(True) is primary
+
+    def test_replication_lag_query_does_not_block(self) -> None:
+        now = [0.0]
+        querying, checked_out = threading.Event(), threading.Event()
+        checked_out_during_query: list[bool] = []
+        primary, replica = _engine_with_lag(1), mock.Mock()
+        connection = primary.connect.return_value.__enter__.return_value
+
+        def slow_query(*args: object) -> object:
+            querying.set()
+            checked_out_during_query.append(checked_out.wait(5))
+            return mock.DEFAULT
+
+        router = ReplicaRouter(
+            primary, [replica], max_lag=5, lag_check_interval=10, clock=lambda: now[0]
+        )
+        assert router.get_engine(True) is replica
+
+        now[0] = 10
+        connection.execute.side_effect = slow_query
+        thread = threading.Thread(target=router.replication_lag)
+        thread.start()
+        assert querying.wait(5)
+        # the previous lag is used while the lag is queried, without a second query
+        assert router.get_engine(True) is replica
+        assert router.replication_lag() == 1
+        checked_out.set()
+        thread.join(5)
+        assert checked_out_during_query == [True]
+        assert connection.execute.call_count == 2
+
+    def test_run(self) -> None:
+        primary, replica = mock.MagicMock(), mock.MagicMock()
+        router = ReplicaRouter(primary, [replica])
+        fn = mock.Mock(return_value="ok")
+
+        assert router.run(fn) == "ok"
+        fn.assert_called_once_with(replica.begin.return_value.__enter__.return_value)
+        assert router.run(fn, read_only=False) == "ok"
+        fn.assert_called_with(primary.begin.return_value.__enter__.return_value)
+
+    def test_run_write_in_replica(self) -> None:
+        primary, replica = mock.MagicMock(), mock.MagicMock()
+        router = ReplicaRouter(primary, [replica])
+        error = HdbcliError(
+            7,
+            "feature not supported: writable statement not allowed in "
+            "read-enabled replication: line 1 col 1",
+        )
+        fn = mock.Mock(side_effect=[DBAPIError(None, None, error), "ok"])
+
+        assert router.run(fn) == "ok"
+        fn.assert_called_with(primary.begin.return_value.__enter__.return_value)
+
+    def test_run_other_error(self) -> None:
+        primary, replica = mock.MagicMock(), mock.MagicMock()
+        router = ReplicaRouter(primary, [replica])
+        error = DBAPIError(None, None, HdbcliError(133, "deadlock"))
+        fn = mock.Mock(side_effect=error)
+
+        with pytest.raises(DBAPIError):
+            router.run(fn)
+        fn.assert_called_once()
+
+
+class TestRoutingSession(TestBase):
+    def test_routing(self) -> None:
+        primary, replica1, replica2 = (create_engine("sqlite://") for _ in range(3))
+        router = ReplicaRouter(primary, [replica1, replica2])
+        session_factory = sessionmaker(class_=RoutingSession, router=router)
+
+        with session_factory(read_only=True) as session:
+            with session.begin():
+                assert session.get_bind() is replica1
+                assert session.get_bind() is replica1
+            with session.begin():
+                assert session.get_bind() is replica2
+
+        with session_factory() as session:
+            assert session.get_bind() is primary
+
+    def test_run_session(self) -> None:
+        primary, replica = create_engine("sqlite://"), create_engine("sqlite://")
+        router = ReplicaRouter(primary, [replica])
+        session_factory = sessionmaker(class_=RoutingSession, router=router)
+
+        def get_bind(session: RoutingSession) -> object:
+            return session.get_bind()
+
+        assert router.run(get_bind, True, session_factory) is replica
+        assert router.run(get_bind, False, session_factory) is primary
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+from typing import Any
+
+import pytest
 from sqlalchemy import (
     Boolean,
     Column,
+    Index,
     Integer,
     MetaData,
     Table,
@@ -18,11 +22,15 @@ from sqlalchemy import (
     select,
     true,
 )
+from sqlalchemy.exc import ArgumentError, CompileError
+from sqlalchemy.schema import CreateIndex
 from sqlalchemy.sql.expression import column, table
 from sqlalchemy.testing.assertions import AssertsCompiledSQL
 from sqlalchemy.testing.fixtures import TestBase
 
 from sqlalchemy_hana.dialect import HANAHDBCLIDialect
+from sqlalchemy_hana.elements import MergeInto, merge_into, top_k_similar
+from sqlalchemy_hana.types import REAL_VECTOR
 
 
 class SQLCompileTest(TestBase, AssertsCompiledSQL):
@@ -229,3 +237,192 @@ class SQLCompileTest(TestBase, AssertsCompiledSQL):
             ),
             "SELECT mytable.myid FROM mytable",
         )
+
+    def test_sql_merge_into(self) -> None:
+        target = table("target", column("id"), column("value"))
+        source = table("source", column("id"), column("value"), column("deleted"))
+
+        self.assert_compile(
+            merge_into(target, source, target.c.id == source.c.id)
+            .when_matched_then_delete(source.c.deleted == true())
+            .when_matched_then_update(
+                {"value": source.c.value}, condition=target.c.value != source.c.value
+            )
+            .when_not_matched_then_insert(
+                {target.c.id: source.c.id, target.c.value: "new"}
+            ),
+            "MERGE INTO target USING source ON target.id = source.id "
+            "WHEN MATCHED AND source.deleted = true THEN DELETE "
+            "WHEN MATCHED AND target.value != source.value "
+            "THEN UPDATE SET value = source.value "
+            "WHEN NOT MATCHED THEN INSERT (id, value) VALUES (source.id, ?)",
+        )
+
+    def test_sql_merge_into_subquery(self) -> None:
+        target = table("target", column("id"), column("value"))
+        source = table("source", column("id"), column("value"))
+        subquery = select(source).where(source.c.id > 5).subquery("delta")
+
+        self.assert_compile(
+            merge_into(
+                target, subquery, target.c.id == subquery.c.id
+            ).when_matched_then_update({"value": subquery.c.value}),
+            "MERGE INTO target USING (SELECT source.id AS id, source.value AS value "
+            "FROM source WHERE source.id > ?) AS delta ON target.id = delta.id "
+            "WHEN MATCHED THEN UPDATE SET value = delta.value",
+        )
+
+    def test_sql_merge_into_cte(self) -> None:
+        target = table("target", column("id"), column("value"))
+        source = table("source", column("id"), column("value"))
+        cte = select(source).where(source.c.id > 5).cte("delta")
+
+        self.assert_compile(
+            merge_into(
+                target, cte, target.c.id == cte.c.id
+            ).when_not_matched_then_insert({"id": cte.c.id, "value": cte.c.value}),
+            "MERGE INTO target USING (SELECT source.id AS id, source.value AS value "
+            "FROM source WHERE source.id > ?) AS delta ON target.id = delta.id "
+            "WHEN NOT MATCHED THEN INSERT (id, value) VALUES (delta.id, delta.value)",
+        )
+
+    def test_sql_merge_into_alias(self) -> None:
+        target = table("target", column("id"), column("value")).alias("t")
+        source = table("source", column("id"), column("value"))
+
+        self.assert_compile(
+            merge_into(
+                target, source, target.c.id == source.c.id
+            ).when_matched_then_update({target.c.value: source.c.value}),
+            "MERGE INTO target AS t USING source ON t.id = source.id "
+            "WHEN MATCHED THEN UPDATE SET value = source.value",
+        )
+
+    def test_sql_merge_into_without_when(self) -> None:
+        target = table("target", column("id"))
+        source = table("source", column("id"))
+
+        with pytest.raises(CompileError, match="WHEN"):
+            merge_into(target, source, target.c.id == source.c.id).compile(
+                dialect=HANAHDBCLIDialect()
+            )
+
+    def test_sql_merge_into_unknown_column(self) -> None:
+        target = table("target", column("id"))
+        source = table("source", column("id"))
+
+        with pytest.raises(ArgumentError, match="target table"):
+            merge_into(
+                target, source, target.c.id == source.c.id
+            ).when_matched_then_update({source.c.id: 1})
+
+    def test_sql_merge_into_cache_key(self) -> None:
+        target = table("target", column("id"), column("value"))
+        source = table("source", column("id"), column("value"))
+
+        def _merge(value: str, condition: bool = False) -> MergeInto:
+            return merge_into(
+                target, source, target.c.id == source.c.id
+            ).when_matched_then_update(
+                {"value": value},
+                condition=source.c.id > 1 if condition else None,
+            )
+
+        def _key(stmt: MergeInto) -> Any:
+            cache_key = stmt._generate_cache_key()
+            assert cache_key is not None
+            return cache_key.key
+
+        assert _key(_merge("a")) == _key(_merge("b"))
+        assert _key(_merge("a")) != _key(_merge("a", condition=True))
+        assert _key(_merge("a")) != _key(
+            _merge("a").when_not_matched_then_insert({"id": source.c.id})
+        )
+
+    def test_sql_create_vector_index(self) -> None:
+        table1 = Table(
+            "mytable",
+            MetaData(),
+            Column("id", Integer),
+            Column("vec", REAL_VECTOR(length=3)),
+        )
+
+        self.assert_compile(
+            CreateIndex(Index("vec_idx", table1.c.vec, hana_index_type="HNSW")),
+            "CREATE HNSW VECTOR INDEX vec_idx ON mytable (vec) "
+            "SIMILARITY FUNCTION COSINE_SIMILARITY",
+        )
+        self.assert_compile(
+            CreateIndex(
+                Index(
+                    "vec_idx",
+                    table1.c.vec,
+                    hana_index_type="hnsw",
+                    hana_similarity_function="l2distance",
+                    hana_build_configuration={"M": 64, "efConstruction": 128},
+                    hana_search_configuration='{"efSearch": 400}',
+                    hana_online=True,
+                )
+            ),
+            "CREATE HNSW VECTOR INDEX vec_idx ON mytable (vec) "
+            "SIMILARITY FUNCTION L2DISTANCE "
+            'BUILD CONFIGURATION \'{"M": 64, "efConstruction": 128}\' '
+            "SEARCH CONFIGURATION '{\"efSearch\": 400}' ONLINE",
+        )
+        self.assert_compile(
+            CreateIndex(Index("id_idx", table1.c.id)),
+            "CREATE INDEX id_idx ON mytable (id)",
+        )
+
+    def test_sql_create_vector_index_invalid(self) -> None:
+        table1 = Table(
+            "mytable",
+            MetaData(),
+            Column("id", Integer),
+            Column("vec", REAL_VECTOR(length=3)),
+        )
+
+        for index, message in (
+            (
+                Index("vec_idx", table1.c.vec, table1.c.id, hana_index_type="HNSW"),
+                "exactly one column",
+            ),
+            (Index("vec_idx", table1.c.vec, hana_index_type="IVF"), "index type"),
+            (
+                Index(
+                    "vec_idx",
+                    table1.c.vec,
+                    hana_index_type="HNSW",
+                    hana_similarity_function="DOT",
+                ),
+                "similarity function",
+            ),
+        ):
+            with pytest.raises(CompileError, match=message):
+                CreateIndex(index).compile(dialect=HANAHDBCLIDialect())
+
+    def test_sql_top_k_similar(self) -> None:
+        table1 = table("mytable", column("id"), column("vec"))
+
+        self.assert_compile(
+            top_k_similar(table1.c.vec, [1, 2, 3], 5),
+            "SELECT mytable.id, mytable.vec FROM mytable "
+            "ORDER BY cosine_similarity(mytable.vec, to_real_vector(?)) DESC LIMIT ?",
+            checkparams={"to_real_vector_1": "[1.0, 2.0, 3.0]", "param_1": 5},
+        )
+        self.assert_compile(
+            top_k_similar(table1.c.vec, "[1, 2, 3]", 5, "L2DISTANCE"),
+            "SELECT mytable.id, mytable.vec FROM mytable "
+            "ORDER BY l2distance(mytable.vec, to_real_vector(?)) ASC LIMIT ?",
+            checkparams={"to_real_vector_1": "[1, 2, 3]", "param_1": 5},
+        )
+
+    def test_sql_top_k_similar_invalid(self) -> None:
+        table1 = table("mytable", column("vec"))
+
+        with pytest.raises(ArgumentError, match="metric"):
+            top_k_similar(table1.c.vec, [1, 2, 3], 5, "DOT")  # type: ignore[arg-type]
+        with pytest.raises(ArgumentError, match="k must"):
+            top_k_similar(table1.c.vec, [1, 2, 3], 0)
+        with pytest.raises(ArgumentError, match="not part of a table"):
+            top_k_similar(column("vec"), [1, 2, 3], 5)
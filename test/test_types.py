@@ -14,6 +14,7 @@ import sqlalchemy
 import sqlalchemy.testing.suite.test_types
 from sqlalchemy import inspect, testing, types
 from sqlalchemy.schema import CreateTable
+from sqlalchemy.testing.engines import testing_engine
 from sqlalchemy.testing.fixtures import TablesTest, TestBase
 from sqlalchemy.testing.schema import Column, Table
 from sqlalchemy.testing.suite.test_types import _DateFixture
@@ -260,6 +261,89 @@ class RealVectorTest(_TypeBaseTest):
             assert columns[1]["type"].length is None
 
 
+class HalfVectorTest(TestBase):
+    # no real test possible because HALF_VECTOR is not supported by all SAP HANA versions
+
+    def test_compile(self, connection, metadata) -> None:
+        mytab = Table(
+            "mytab",
+            metadata,
+            Column("vec1", hana_types.HALF_VECTOR(length=10)),
+            Column("vec2", hana_types.HALF_VECTOR()),
+        )
+        assert (
+            str(CreateTable(mytab).compile(connection))
+            == "\nCREATE TABLE mytab (\n\tvec1 HALF_VECTOR(10), \n\tvec2 HALF_VECTOR\n)\n\n"
+        )
+
+
+class SpatialTest(TestBase):
+
+    def test_compile(self, connection, metadata) -> None:
+        mytab = Table(
+            "mytab",
+            metadata,
+            Column("geometry", hana_types.ST_GEOMETRY()),
+            Column("point", hana_types.ST_POINT(srid=4326)),
+        )
+        assert (
+            str(CreateTable(mytab).compile(connection))
+            == "\nCREATE TABLE mytab (\n\tgeometry ST_GEOMETRY, \n\tpoint ST_POINT(4326)\n)\n\n"
+        )
+
+
+class RealVectorNumpyTest(TablesTest):
+    @classmethod
+    def define_tables(cls, metadata):
+        Table(
+            "vector_table",
+            metadata,
+            Column("id", sqlalchemy.Integer, primary_key=True),
+            Column("vec", hana_types.REAL_VECTOR(length=4)),
+        )
+
+    def test_processors(self):
+        numpy = pytest.importorskip("numpy")
+        dialect = testing.db.dialect
+        with mock.patch.object(dialect, "vector_output_type", "numpy"):
+            vector_type = hana_types.REAL_VECTOR()
+            bind = vector_type.bind_processor(dialect)
+            result = vector_type.result_processor(dialect, None)
+
+        value = bind(numpy.array([1.0, 2.0, 3.0], dtype=numpy.float64))
+        assert bytes(value) == (
+            b"\x03\x00\x00\x00" + numpy.array([1, 2, 3], dtype="<f4").tobytes()
+        )
+        assert bind([1.0, 2.0]) == [1.0, 2.0]
+
+        array = result(value)
+        assert array.dtype == numpy.float32
+        assert array.tolist() == [1.0, 2.0, 3.0]
+        assert result(None) is None
+
+        with pytest.raises(ValueError, match="one-dimensional"):
+            bind(numpy.zeros((2, 2)))
+
+    def test_round_trip(self):
+        numpy = pytest.importorskip("numpy")
+        table = self.tables.vector_table
+        engine = testing_engine(options={"vector_output_type": "numpy"})
+        vectors = numpy.arange(40, dtype=numpy.float32).reshape(10, 4)
+
+        with engine.begin() as connection:
+            connection.execute(
+                table.insert(),
+                [{"id": i, "vec": vector} for i, vector in enumerate(vectors)],
+            )
+            rows = connection.execute(
+                sqlalchemy.select(table.c.vec).order_by(table.c.id)
+            ).scalars()
+            result = numpy.stack(list(rows))
+
+        assert result.dtype == numpy.float32
+        numpy.testing.assert_array_equal(result, vectors)
+
+
 class StringUUIDAsStringTest(_TypeBaseTest):
     column_type = hana_types.Uuid(as_uuid=False)
     data = "9f01b2fb-bf0d-4b46-873c-15d0976b4100"